@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Offline Hansard Corpus Store
+Packs mentions into an append-only data file with a contributionExtId hash
+index, both read through mmap so lookups are O(1) and only decode the
+records that are actually requested.
+
+Usage:
+    python corpus_store.py build sentiment_batches/batch_*.json
+    python corpus_store.py get AAE69607-52B1-44B0-B39E-0B7A1A519166
+"""
+
+import json
+import struct
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional
+
+from sentiment_common import lazy_import
+from sentiment_common.files import write_atomic
+
+# Report CLIs import this module even when no corpus exists; hashlib (OpenSSL)
+# and mmap are only loaded once a corpus is opened or built
+hashlib = lazy_import('hashlib')
+mmap = lazy_import('mmap')
+
+DEFAULT_CORPUS_DIR = Path('sentiment_batches/corpus')
+
+DATA_FILE = 'corpus.dat'
+INDEX_FILE = 'corpus.idx'
+
+DATA_MAGIC = b'HCDAT001'
+INDEX_MAGIC = b'HCIDX001'
+
+# Data records: u16 id length, u32 payload length, id bytes, JSON payload
+RECORD_HEADER = struct.Struct('<HI')
+# Index header: magic, slot count, live key count
+INDEX_HEADER = struct.Struct('<8sQQ')
+# Index slots: u64 key hash (0 = empty), u64 record offset
+SLOT = struct.Struct('<QQ')
+
+MIN_SLOTS = 1024
+MAX_LOAD = 0.5
+
+
+def key_hash(ext_id: str) -> int:
+    digest = hashlib.blake2b(ext_id.encode('utf-8'), digest_size=8).digest()
+    # Zero marks an empty slot
+    return int.from_bytes(digest, 'little') or 1
+
+
+class CorpusStore:
+    """
+    Read/append access to a packed mention corpus.
+
+    The data file only ever grows; re-adding an ID with different content
+    appends a new record and repoints the index, while identical content is
+    skipped. The index is an open-addressing table with linear probing that
+    is rewritten atomically whenever records are appended.
+    """
+
+    def __init__(self, directory: Path = DEFAULT_CORPUS_DIR):
+        self.directory = Path(directory)
+        self.data_path = self.directory / DATA_FILE
+        self.index_path = self.directory / INDEX_FILE
+        self._data = None
+        self._index = None
+        self._slots = 0
+        self._count = 0
+        self._open()
+
+    @classmethod
+    def open_if_exists(cls, directory: Path = DEFAULT_CORPUS_DIR) -> Optional['CorpusStore']:
+        """Return a store for directory, or None when no corpus has been built there."""
+        if not (Path(directory) / INDEX_FILE).exists():
+            return None
+        return cls(directory)
+
+    def _open(self):
+        self.close()
+        if not self.index_path.exists():
+            return
+        with open(self.data_path, 'rb') as f:
+            if f.read(len(DATA_MAGIC)) != DATA_MAGIC:
+                raise ValueError(f"{self.data_path} is not a corpus data file")
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        with open(self.index_path, 'rb') as f:
+            self._index = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._slots, self._count = INDEX_HEADER.unpack_from(self._index, 0)
+        if magic != INDEX_MAGIC:
+            raise ValueError(f"{self.index_path} is not a corpus index file")
+
+    def close(self):
+        for view in (self._data, self._index):
+            if view is not None:
+                view.close()
+        self._data = None
+        self._index = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, ext_id: str) -> bool:
+        return self._find(ext_id) is not None
+
+    def _record_at(self, offset: int) -> tuple:
+        id_len, payload_len = RECORD_HEADER.unpack_from(self._data, offset)
+        id_start = offset + RECORD_HEADER.size
+        payload_start = id_start + id_len
+        return self._data[id_start:payload_start], payload_start, payload_len
+
+    def _find(self, ext_id: str) -> Optional[int]:
+        if not self._slots:
+            return None
+        target = key_hash(ext_id)
+        wanted = ext_id.encode('utf-8')
+        slot = target % self._slots
+        while True:
+            stored, offset = SLOT.unpack_from(self._index, INDEX_HEADER.size + slot * SLOT.size)
+            if stored == 0:
+                return None
+            # Hashes can collide, so confirm against the stored ID without decoding the payload
+            if stored == target and self._record_at(offset)[0] == wanted:
+                return offset
+            slot = (slot + 1) % self._slots
+
+    def get_raw(self, ext_id: str) -> Optional[bytes]:
+        """Return the undecoded JSON bytes for ext_id."""
+        offset = self._find(ext_id)
+        if offset is None:
+            return None
+        _, start, length = self._record_at(offset)
+        return self._data[start:start + length]
+
+    def get(self, ext_id: str) -> Optional[Dict]:
+        raw = self.get_raw(ext_id)
+        return json.loads(raw) if raw is not None else None
+
+    def context_text(self, ext_id: str) -> Optional[str]:
+        mention = self.get(ext_id)
+        return mention.get('contextText') if mention else None
+
+    def iter_offsets(self) -> Iterator[tuple]:
+        """Yield (ext_id, offset) for every live index entry."""
+        for slot in range(self._slots):
+            stored, offset = SLOT.unpack_from(self._index, INDEX_HEADER.size + slot * SLOT.size)
+            if stored:
+                yield self._record_at(offset)[0].decode('utf-8'), offset
+
+    def append(self, mentions: Iterable[Dict]) -> int:
+        """Append mentions to the data file and republish the index. Returns records written."""
+        entries = dict(self.iter_offsets()) if self._index is not None else {}
+        new_file = not self.data_path.exists()
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        appended = {}
+        written = 0
+        with open(self.data_path, 'ab') as f:
+            if new_file:
+                f.write(DATA_MAGIC)
+            offset = f.tell()
+            for mention in mentions:
+                ext_id = mention['contributionExtId']
+                payload = json.dumps(mention, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+                digest = hashlib.blake2b(payload, digest_size=16).digest()
+                if ext_id in appended:
+                    if appended[ext_id] == digest:
+                        continue
+                elif ext_id in entries and self.get_raw(ext_id) == payload:
+                    continue
+                appended[ext_id] = digest
+                id_bytes = ext_id.encode('utf-8')
+                f.write(RECORD_HEADER.pack(len(id_bytes), len(payload)))
+                f.write(id_bytes)
+                f.write(payload)
+                entries[ext_id] = offset
+                offset += RECORD_HEADER.size + len(id_bytes) + len(payload)
+                written += 1
+
+        if written or new_file:
+            self._write_index(entries)
+            self._open()
+        return written
+
+    def _write_index(self, entries: Dict[str, int]):
+        slots = MIN_SLOTS
+        while len(entries) > slots * MAX_LOAD:
+            slots *= 2
+
+        table = bytearray(INDEX_HEADER.size + slots * SLOT.size)
+        INDEX_HEADER.pack_into(table, 0, INDEX_MAGIC, slots, len(entries))
+        for ext_id, offset in entries.items():
+            h = key_hash(ext_id)
+            slot = h % slots
+            while SLOT.unpack_from(table, INDEX_HEADER.size + slot * SLOT.size)[0]:
+                slot = (slot + 1) % slots
+            SLOT.pack_into(table, INDEX_HEADER.size + slot * SLOT.size, h, offset)
+
+        # Readers holding the old mapping keep a consistent view until they reopen
+        write_atomic(self.index_path, table)
+
+
+def iter_batch_mentions(paths: Iterable[Path]) -> Iterator[Dict]:
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            yield from json.load(f)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build and query the offline Hansard corpus store")
+    parser.add_argument('--corpus', type=Path, default=DEFAULT_CORPUS_DIR)
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    build = sub.add_parser('build', help="Append mention batch files to the corpus")
+    build.add_argument('batches', nargs='+', type=Path)
+
+    get = sub.add_parser('get', help="Print the mention stored for a contributionExtId")
+    get.add_argument('ext_id')
+
+    args = parser.parse_args()
+
+    store = CorpusStore(args.corpus)
+    if args.command == 'build':
+        written = store.append(iter_batch_mentions(args.batches))
+        print(f"Appended {written} records ({len(store)} mentions indexed) to {args.corpus}")
+    else:
+        mention = store.get(args.ext_id)
+        if mention is None:
+            raise SystemExit(f"{args.ext_id} not found in {args.corpus}")
+        print(json.dumps(mention, indent=2, ensure_ascii=False))
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,10 +4,17 @@ Enhanced Sentiment Analysis with Manual Review
 Provides more detailed analysis and specific recommendations
 """
 
+import io
 import json
 import re
-from datetime import datetime
-from typing import Dict, List, Tuple, NamedTuple
+import time
+from collections import Counter
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Tuple, NamedTuple
+
+# Only needed for annotations here; main() and the report writers import them
+if TYPE_CHECKING:
+    from corpus_store import CorpusStore
+    from report_renderer import ReportRenderer
 
 class SentimentDiscrepancy(NamedTuple):
     ext_id: str
@@ -20,7 +27,10 @@ class SentimentDiscrepancy(NamedTuple):
     recommendation: str
 
 class EnhancedAnalyzer:
-    def __init__(self):
+    def __init__(self, results_path: str = 'secondary_sentiment_results.json', corpus: 'CorpusStore' = None):
+        self.results_path = results_path
+        self.corpus = corpus
+        
         self.positive_phrases = [
             'welcome', 'support', 'excellent', 'opportunity', 'progress', 'thank', 
             'congratulations', 'great', 'fantastic', 'important', 'valuable', 
@@ -42,17 +52,18 @@ class EnhancedAnalyzer:
     
     def analyze_discrepancies_manually(self) -> List[SentimentDiscrepancy]:
         """Manually review key discrepancies with expert judgment"""
-        
-        # Load results
-        with open('secondary_sentiment_results.json', 'r') as f:
+        return list(self.iter_reviews(self._load_discrepancies()))
+    
+    def _load_discrepancies(self) -> List[Dict]:
+        with open(self.results_path, 'r') as f:
             results = json.load(f)
-        
-        discrepancies = results['discrepancies']
-        manual_reviews = []
-        
+        return results['discrepancies']
+    
+    def iter_reviews(self, discrepancies: Iterable[Dict]) -> Iterator[SentimentDiscrepancy]:
+        """Yield a reviewed discrepancy at a time so reports can stream them"""
         for disc in discrepancies:
             recommendation = self._make_recommendation(disc)
-            review = SentimentDiscrepancy(
+            yield SentimentDiscrepancy(
                 ext_id=disc['ext_id'],
                 speaker=disc['speaker'],
                 date=disc['date'],
@@ -62,9 +73,6 @@ class EnhancedAnalyzer:
                 reasoning=disc['existing_reasoning'],
                 recommendation=recommendation
             )
-            manual_reviews.append(review)
-        
-        return manual_reviews
     
     def _make_recommendation(self, discrepancy: Dict) -> str:
         """Make expert judgment recommendation based on context"""
@@ -102,102 +110,119 @@ class EnhancedAnalyzer:
         return default
     
     def generate_enhanced_report(self) -> str:
-        """Generate detailed enhanced analysis report"""
+        """Generate detailed enhanced analysis report as a single string"""
+        from report_renderer import ReportRenderer
+
+        buffer = io.StringIO()
+        self.write_enhanced_report(ReportRenderer(buffer))
+        return buffer.getvalue()
+    
+    def write_enhanced_report(self, renderer: 'ReportRenderer'):
+        """Stream the enhanced analysis report through renderer"""
         
-        manual_reviews = self.analyze_discrepancies_manually()
+        discrepancies = self._load_discrepancies()
         
-        # Group by recommendation type
-        recommendations = {}
-        for review in manual_reviews:
-            key = review.recommendation
-            if key not in recommendations:
-                recommendations[key] = []
-            recommendations[key].append(review)
+        # First pass only counts, so every review can be streamed per group below
+        recommendations = Counter(review.recommendation for review in self.iter_reviews(discrepancies))
+        total_discrepancies = sum(recommendations.values())
         
-        report = []
-        report.append("# Enhanced Sentiment Analysis Report")
-        report.append("=" * 50)
-        report.append(f"Analysis Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report.append(f"Total Discrepancies Reviewed: {len(manual_reviews)}")
-        report.append("")
+        renderer.title("Enhanced Sentiment Analysis Report", rule_width=50)
+        renderer.text(f"Analysis Date: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+        renderer.text(f"Total Discrepancies Reviewed: {total_discrepancies}")
+        renderer.blank()
         
         # Summary of recommendations
-        report.append("## Manual Review Summary")
-        for rec_type, reviews in recommendations.items():
-            percentage = (len(reviews) / len(manual_reviews)) * 100
-            report.append(f"**{rec_type}**: {len(reviews)} cases ({percentage:.1f}%)")
-        report.append("")
+        renderer.heading("Manual Review Summary")
+        for rec_type, count in recommendations.items():
+            percentage = (count / total_discrepancies) * 100
+            renderer.text(f"**{rec_type}**: {count} cases ({percentage:.1f}%)")
+        renderer.blank()
         
         # Detailed analysis by recommendation type
-        for rec_type, reviews in recommendations.items():
-            if not reviews:
-                continue
-                
-            report.append(f"## {rec_type.upper()}")
-            report.append("")
+        for rec_type in recommendations:
+            renderer.heading(rec_type.upper())
+            renderer.blank()
             
-            for review in reviews[:5]:  # Show top 5 examples
-                report.append(f"### {review.speaker}")
-                report.append(f"- **Reasoning**: {review.reasoning}")
-                report.append(f"- **Original**: {review.original} → **Independent**: {review.independent}")
-                report.append(f"- **Confidence**: {review.confidence:.2f}")
-                report.append("")
+            reviews = (r for r in self.iter_reviews(discrepancies) if r.recommendation == rec_type)
+            renderer.items(rec_type, reviews, self._render_review)
         
         # Methodology assessment
-        report.append("## Methodology Assessment")
-        report.append("### Strengths of Original Analysis:")
-        report.append("- Contextual understanding of parliamentary proceedings")
-        report.append("- Nuanced interpretation of political language")
-        report.append("- Appropriate classification of procedural vs substantive statements")
-        report.append("")
-        
-        report.append("### Limitations of Automated Analysis:")
-        report.append("- Requires full contribution text for accurate analysis")
-        report.append("- Political context and speaker intent difficult to capture algorithmically")
-        report.append("- Parliamentary language often formal and nuanced")
-        report.append("")
+        renderer.heading("Methodology Assessment")
+        renderer.heading("Strengths of Original Analysis:", level=3)
+        renderer.bullet("Contextual understanding of parliamentary proceedings")
+        renderer.bullet("Nuanced interpretation of political language")
+        renderer.bullet("Appropriate classification of procedural vs substantive statements")
+        renderer.blank()
+        
+        renderer.heading("Limitations of Automated Analysis:", level=3)
+        renderer.bullet("Requires full contribution text for accurate analysis")
+        renderer.bullet("Political context and speaker intent difficult to capture algorithmically")
+        renderer.bullet("Parliamentary language often formal and nuanced")
+        renderer.blank()
         
         # Final recommendation
-        keep_count = len(recommendations.get("KEEP original", [])) + len(recommendations.get("KEEP original (low confidence in independent analysis)", []))
-        change_count = len(recommendations.get("CONSIDER CHANGE", []))
-        total_discrepancies = len(manual_reviews)
+        keep_count = recommendations.get("KEEP original", 0) + recommendations.get("KEEP original (low confidence in independent analysis)", 0)
+        change_count = recommendations.get("CONSIDER CHANGE", 0)
         
-        report.append("## Final Recommendation")
+        renderer.heading("Final Recommendation")
         final_agreement_rate = 70.2 + (keep_count / total_discrepancies) * 29.8  # Calculate final effective agreement
         
-        report.append(f"**Effective Agreement Rate After Manual Review**: {final_agreement_rate:.1f}%")
-        report.append("")
+        renderer.text(f"**Effective Agreement Rate After Manual Review**: {final_agreement_rate:.1f}%")
+        renderer.blank()
         
         if final_agreement_rate >= 85:
-            report.append("✅ **ORIGINAL ANALYSIS IS HIGHLY RELIABLE**")
-            report.append("Manual review confirms most original classifications are accurate.")
-            report.append(f"Only {change_count} of {total_discrepancies} discrepancies warrant potential changes.")
+            renderer.text("✅ **ORIGINAL ANALYSIS IS HIGHLY RELIABLE**")
+            renderer.text("Manual review confirms most original classifications are accurate.")
+            renderer.text(f"Only {change_count} of {total_discrepancies} discrepancies warrant potential changes.")
         elif final_agreement_rate >= 75:
-            report.append("✅ **ORIGINAL ANALYSIS IS RELIABLE WITH MINOR REFINEMENTS**")
-            report.append("Strong overall reliability with a few cases that could benefit from reconsideration.")
+            renderer.text("✅ **ORIGINAL ANALYSIS IS RELIABLE WITH MINOR REFINEMENTS**")
+            renderer.text("Strong overall reliability with a few cases that could benefit from reconsideration.")
         else:
-            report.append("⚠️ **CONSIDER SYSTEMATIC REVIEW**")
-            report.append("Several discrepancies suggest the methodology could be refined.")
-        
-        report.append("")
-        report.append("### Specific Actions Recommended:")
-        report.append(f"- **Review**: {change_count} cases where methodology may need adjustment")
-        report.append(f"- **Maintain**: {keep_count} existing classifications as accurate")
-        report.append("- **Document**: Clear guidelines for parliamentary sentiment analysis")
-        report.append("- **Validate**: Future analyses with multiple reviewers")
-        
-        return "\n".join(report)
+            renderer.text("⚠️ **CONSIDER SYSTEMATIC REVIEW**")
+            renderer.text("Several discrepancies suggest the methodology could be refined.")
+        
+        renderer.blank()
+        renderer.heading("Specific Actions Recommended:", level=3)
+        renderer.bullet(f"**Review**: {change_count} cases where methodology may need adjustment")
+        renderer.bullet(f"**Maintain**: {keep_count} existing classifications as accurate")
+        renderer.bullet("**Document**: Clear guidelines for parliamentary sentiment analysis")
+        renderer.bullet("**Validate**: Future analyses with multiple reviewers")
+    
+    def _render_review(self, renderer: 'ReportRenderer', index: int, review: SentimentDiscrepancy):
+        renderer.heading(review.speaker, level=3)
+        renderer.bullet(f"**Reasoning**: {review.reasoning}")
+        renderer.bullet(f"**Original**: {review.original} → **Independent**: {review.independent}")
+        renderer.bullet(f"**Confidence**: {review.confidence:.2f}")
+        context = self.corpus.context_text(review.ext_id) if self.corpus else None
+        if context:
+            renderer.bullet(f"**Context**: {context}")
+        renderer.blank()
 
 def main():
-    analyzer = EnhancedAnalyzer()
-    enhanced_report = analyzer.generate_enhanced_report()
+    import argparse
+
+    from corpus_store import DEFAULT_CORPUS_DIR, CorpusStore
+    from report_renderer import open_report
+
+    parser = argparse.ArgumentParser(description="Review sentiment discrepancies and write the enhanced report")
+    parser.add_argument('--results', default='secondary_sentiment_results.json',
+                        help="Verification results produced by sentiment_verification.py")
+    parser.add_argument('--report', default='enhanced_sentiment_analysis.md',
+                        help="Report path; a .html suffix renders HTML")
+    parser.add_argument('--page-size', type=int, default=None,
+                        help="Split each recommendation group into per-section files of this many entries")
+    parser.add_argument('--corpus', default=DEFAULT_CORPUS_DIR,
+                        help="Corpus store built by corpus_store.py, used to add contribution text")
+    args = parser.parse_args()
+    
+    analyzer = EnhancedAnalyzer(args.results, CorpusStore.open_if_exists(args.corpus))
     
-    # Save enhanced report
-    with open('enhanced_sentiment_analysis.md', 'w') as f:
-        f.write(enhanced_report)
+    # Stream enhanced report to disk
+    with open_report(args.report, page_size=args.page_size) as renderer:
+        analyzer.write_enhanced_report(renderer)
     
     print("Enhanced analysis complete!")
-    print(f"Report saved to: enhanced_sentiment_analysis.md")
+    print(f"Report saved to: {args.report}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Streaming Report Renderer
+Writes Markdown or HTML report sections straight to disk from iterators,
+with optional paging of long sections into per-section files
+"""
+
+import html
+import re
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, Optional, TextIO
+
+BOLD_PATTERN = re.compile(r'\*\*(.+?)\*\*')
+
+
+class Markup(str):
+    """Text already rendered in the output format, written without escaping"""
+
+
+def slugify(text: str) -> str:
+    """Turn a section title into a file-system friendly slug"""
+    slug = re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')
+    return slug or 'section'
+
+
+class MarkdownFormat:
+    extension = '.md'
+
+    def begin(self, title: str) -> str:
+        return f"# {title}\n"
+
+    def end(self) -> str:
+        return ""
+
+    def heading(self, text: str, level: int) -> str:
+        return f"{'#' * level} {text}\n"
+
+    def rule(self, width: int) -> str:
+        return "=" * width + "\n"
+
+    def text(self, line: str) -> str:
+        return f"{line}\n"
+
+    def bullet(self, line: str) -> str:
+        return f"- {line}\n"
+
+    def blank(self) -> str:
+        return "\n"
+
+    def link(self, label: str, href: str) -> str:
+        return Markup(f"[{label}]({href})")
+
+    def table_start(self, headers: List[str]) -> str:
+        head = "| " + " | ".join(headers) + " |\n"
+        sep = "|" + "|".join('-' * (len(h) + 2) for h in headers) + "|\n"
+        return head + sep
+
+    def table_row(self, cells: List[str]) -> str:
+        return "| " + " | ".join(cells) + " |\n"
+
+    def table_end(self) -> str:
+        return ""
+
+
+class HtmlFormat:
+    extension = '.html'
+
+    def _inline(self, text: str) -> str:
+        # Only markup produced by link() passes through; anything else may be
+        # contribution text and is escaped
+        if isinstance(text, Markup):
+            return text
+        return BOLD_PATTERN.sub(r'<strong>\1</strong>', html.escape(text, quote=False))
+
+    def begin(self, title: str) -> str:
+        return (
+            "<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n"
+            f"<title>{html.escape(title)}</title>\n</head>\n<body>\n"
+            f"<h1>{self._inline(title)}</h1>\n"
+        )
+
+    def end(self) -> str:
+        return "</body>\n</html>\n"
+
+    def heading(self, text: str, level: int) -> str:
+        return f"<h{level}>{self._inline(text)}</h{level}>\n"
+
+    def rule(self, width: int) -> str:
+        return "<hr>\n"
+
+    def text(self, line: str) -> str:
+        return f"<p>{self._inline(line)}</p>\n"
+
+    def bullet(self, line: str) -> str:
+        # Each bullet is its own list so items can be streamed without lookahead
+        return f"<ul><li>{self._inline(line)}</li></ul>\n"
+
+    def blank(self) -> str:
+        return ""
+
+    def link(self, label: str, href: str) -> str:
+        return Markup(f'<a href="{html.escape(href)}">{html.escape(label, quote=False)}</a>')
+
+    def table_start(self, headers: List[str]) -> str:
+        cells = "".join(f"<th>{self._inline(h)}</th>" for h in headers)
+        return f"<table>\n<tr>{cells}</tr>\n"
+
+    def table_row(self, cells: List[str]) -> str:
+        row = "".join(f"<td>{self._inline(c)}</td>" for c in cells)
+        return f"<tr>{row}</tr>\n"
+
+    def table_end(self) -> str:
+        return "</table>\n"
+
+
+FORMATS = {
+    'md': MarkdownFormat,
+    'markdown': MarkdownFormat,
+    'html': HtmlFormat,
+}
+
+
+class ReportRenderer:
+    """
+    Writes report elements to a text stream as soon as they are produced.
+
+    Nothing is buffered beyond the underlying file object, so sections can be
+    fed from generators over arbitrarily many results.
+    """
+
+    def __init__(self, stream: TextIO, fmt: str = 'md', page_dir: Optional[Path] = None,
+                 page_size: Optional[int] = None):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown report format: {fmt}")
+        self.stream = stream
+        self.fmt_name = fmt
+        self.fmt = FORMATS[fmt]()
+        self.page_dir = page_dir
+        self.page_size = page_size
+
+    def title(self, text: str, rule_width: int = 0):
+        self.stream.write(self.fmt.begin(text))
+        if rule_width:
+            self.stream.write(self.fmt.rule(rule_width))
+
+    def finish(self):
+        self.stream.write(self.fmt.end())
+
+    def heading(self, text: str, level: int = 2):
+        self.stream.write(self.fmt.heading(text, level))
+
+    def text(self, line: str):
+        self.stream.write(self.fmt.text(line))
+
+    def bullet(self, line: str):
+        self.stream.write(self.fmt.bullet(line))
+
+    def bullets(self, lines: Iterable[str]):
+        for line in lines:
+            self.bullet(line)
+
+    def blank(self):
+        self.stream.write(self.fmt.blank())
+
+    def link(self, label: str, href: str) -> str:
+        return self.fmt.link(label, href)
+
+    def table(self, headers: List[str], rows: Iterable[List[str]]):
+        self.stream.write(self.fmt.table_start(headers))
+        for row in rows:
+            self.stream.write(self.fmt.table_row([c if isinstance(c, str) else str(c) for c in row]))
+        self.stream.write(self.fmt.table_end())
+
+    def items(self, title: str, items: Iterable,
+              render_item: Callable[['ReportRenderer', int, object], None]) -> int:
+        """
+        Render every item of a section, paging into separate files when configured.
+
+        render_item is called as render_item(renderer, index, item) with a 1-based
+        index and must write the item through the renderer it is given. Returns
+        the number of items rendered.
+        """
+        if self.page_dir is None or not self.page_size:
+            count = 0
+            for count, item in enumerate(items, 1):
+                render_item(self, count, item)
+            return count
+        return self._paged_items(title, iter(items), render_item)
+
+    def _page_path(self, slug: str, page: int) -> Path:
+        return self.page_dir / f"{slug}-{page:03d}{self.fmt.extension}"
+
+    def _clear_pages(self, slug: str):
+        """Remove a section's pages from an earlier run so a shorter section leaves none behind"""
+        page_name = re.compile(rf'{re.escape(slug)}-\d{{3,}}{re.escape(self.fmt.extension)}')
+        for path in self.page_dir.glob(f"{slug}-*{self.fmt.extension}"):
+            if page_name.fullmatch(path.name):
+                path.unlink()
+
+    def _paged_items(self, title: str, items: Iterator, render_item: Callable) -> int:
+        slug = slugify(title)
+        self.page_dir.mkdir(parents=True, exist_ok=True)
+        self._clear_pages(slug)
+        count = 0
+        page = 0
+        pending = next(items, _END)
+
+        while pending is not _END:
+            page += 1
+            path = self._page_path(slug, page)
+            first = count + 1
+            with open(path, 'w', encoding='utf-8') as f:
+                sub = ReportRenderer(f, self.fmt_name)
+                sub.title(f"{title} (page {page})")
+                for _ in range(self.page_size):
+                    if pending is _END:
+                        break
+                    count += 1
+                    render_item(sub, count, pending)
+                    pending = next(items, _END)
+
+                nav = []
+                if page > 1:
+                    nav.append(sub.link("Previous", self._page_path(slug, page - 1).name))
+                if pending is not _END:
+                    nav.append(sub.link("Next", self._page_path(slug, page + 1).name))
+                if nav:
+                    sub.text(Markup(" | ".join(nav)))
+                sub.finish()
+
+            href = f"{self.page_dir.name}/{path.name}"
+            self.bullet(self.link(f"{title} — items {first}-{count}", href))
+
+        return count
+
+
+_END = object()
+
+
+@contextmanager
+def open_report(path: str, fmt: Optional[str] = None, page_size: Optional[int] = None):
+    """
+    Open a streaming report at path.
+
+    The format is inferred from the file suffix unless given. When page_size is
+    set, long sections are split into files under '<stem>_pages/' next to the
+    report and linked from the main document. The closing markup is written
+    when the block exits.
+    """
+    path = Path(path)
+    if fmt is None:
+        fmt = 'html' if path.suffix.lower() in ('.html', '.htm') else 'md'
+    page_dir = path.parent / f"{path.stem}_pages" if page_size else None
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(path, 'w', encoding='utf-8') as f:
+        renderer = ReportRenderer(f, fmt, page_dir=page_dir, page_size=page_size)
+        yield renderer
+        renderer.finish()
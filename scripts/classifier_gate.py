@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+Differential correctness and performance gate for classifier changes.
+Runs a reference and a candidate implementation of classify_sentiment,
+is_false_positive and SentimentAnalyzer.analyze_metadata_sentiment over every
+sentiment_batches mention plus fuzzed variants, diffs labels, confidences and
+reasoning record by record, and compares throughput and peak memory.
+
+The reference defaults to the committed HEAD; the candidate to the working
+tree. Each implementation runs in its own interpreter so neither sees the
+other's modules.
+
+Usage:
+    python scripts/classifier_gate.py
+    python scripts/classifier_gate.py --reference-rev v1.2 --fuzz 3 --allow gate_allow.json
+    python scripts/classifier_gate.py --candidate-root ../faster-engine --max-slowdown 0.05
+"""
+
+import argparse
+import fnmatch
+import json
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+# Make the top-level sentiment_verification module importable when run as a script
+sys.path.insert(0, str(REPO_ROOT))
+
+from sentiment_verification import parse_sentiment_entries  # noqa: E402
+
+TARGETS = {
+    'classify_sentiment': ('scripts/sentiment_analysis.py', None),
+    'is_false_positive': ('scripts/sentiment_analysis.py', None),
+    'analyze_metadata_sentiment': ('sentiment_verification.py', 'SentimentAnalyzer'),
+}
+
+# Words chosen to move every classifier across its thresholds when injected
+FUZZ_WORDS = [
+    'welcome', 'opportunity', 'risk', 'concern', 'question', 'procedural',
+    'artificial intelligence', 'AI', 'Minister', 'Shadow', 'criticizing', 'supportive',
+]
+
+
+# ---------------------------------------------------------------------------
+# Input generation
+
+
+def _split_ai(text: str, rng: random.Random) -> str:
+    """Reproduce Hansard highlighting artefacts by spacing out 'ai' inside words."""
+    return re.sub(r'(\w)(ai)(\w)', lambda m: f'{m.group(1)} {m.group(2)} {m.group(3)}' if rng.random() < 0.5 else m.group(0), text)
+
+
+def _mutators():
+    return [
+        lambda t, rng: t.upper(),
+        lambda t, rng: t.lower(),
+        _split_ai,
+        lambda t, rng: re.sub(r'\s+', lambda m: rng.choice([' ', '  ', '\n', ' \n ']), t),
+        lambda t, rng: t[:rng.randint(0, len(t))],
+        lambda t, rng: ' '.join(rng.sample(t.split('. '), len(t.split('. ')))),
+        lambda t, rng: f'{t} {rng.choice(FUZZ_WORDS)}',
+        lambda t, rng: f'{rng.choice(FUZZ_WORDS)} {t}',
+        lambda t, rng: t.replace("'", '’').replace('"', '“').replace('-', '–'),
+        lambda t, rng: re.sub(r'\bAI\b', rng.choice(['A I', 'Ai', 'A.I.', 'AIs']), t),
+    ]
+
+
+def fuzz(text: str, rng: random.Random, rounds: int = 2) -> str:
+    mutators = _mutators()
+    for _ in range(rounds):
+        text = rng.choice(mutators)(text, rng)
+    return text
+
+
+def load_mentions(batch_dir: Path) -> list:
+    mentions = []
+    for path in sorted(batch_dir.glob('batch_*.json')):
+        with open(path, 'r', encoding='utf-8') as f:
+            mentions.extend(json.load(f))
+    return mentions
+
+
+def build_inputs(mentions: list, sentiment_data: str, variants: int, seed: int) -> dict:
+    """Return {target: [{'id', 'args'}]} covering real and fuzzed inputs."""
+    rng = random.Random(seed)
+    inputs = {name: [] for name in TARGETS}
+
+    for mention in mentions:
+        ext_id = mention['contributionExtId']
+        context = mention.get('contextText', '')
+        title = mention.get('debateTitle', '')
+        cases = [(ext_id, context, title)]
+        cases += [(f'{ext_id}#fuzz{k}', fuzz(context, rng), fuzz(title, rng, 1)) for k in range(1, variants + 1)]
+        for case_id, case_context, case_title in cases:
+            inputs['classify_sentiment'].append({'id': case_id, 'args': [case_context, case_title]})
+            inputs['is_false_positive'].append({'id': case_id, 'args': [case_context]})
+
+        # Speaker names and debate titles stand in for the metadata the verifier sees
+        speaker = mention.get('memberName', '')
+        inputs['analyze_metadata_sentiment'].append({'id': f'{ext_id}#meta', 'args': [speaker, title]})
+
+    for speaker_date, reasoning, ext_id, _ in parse_sentiment_entries(sentiment_data):
+        speaker = speaker_date.split(' - ')[0]
+        cases = [(ext_id, speaker, reasoning)]
+        cases += [(f'{ext_id}#fuzz{k}', fuzz(speaker, rng, 1), fuzz(reasoning, rng))
+                  for k in range(1, variants + 1)]
+        for case_id, case_speaker, case_reasoning in cases:
+            inputs['analyze_metadata_sentiment'].append({'id': case_id, 'args': [case_speaker, case_reasoning]})
+
+    return inputs
+
+
+# ---------------------------------------------------------------------------
+# Worker: runs one implementation tree in a fresh interpreter
+
+
+def _load_target(root: Path, name: str):
+    import importlib.util
+
+    relative, class_name = TARGETS[name]
+    path = root / relative
+    sys.path[:0] = [str(path.parent), str(root)]
+    spec = importlib.util.spec_from_file_location(f'gate_{path.stem}', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    if class_name:
+        return getattr(getattr(module, class_name)(), name)
+    return getattr(module, name)
+
+
+def _normalise(result) -> dict:
+    if isinstance(result, tuple):
+        label, confidence, reasoning = result
+        return {'label': label, 'confidence': confidence, 'reasoning': reasoning}
+    return {'label': result, 'confidence': None, 'reasoning': None}
+
+
+def run_worker(root: Path, inputs_path: Path, out_path: Path, repeat: int):
+    import os
+    import tracemalloc
+
+    os.chdir(root)
+    with open(inputs_path, 'r', encoding='utf-8') as f:
+        inputs = json.load(f)
+
+    report = {}
+    for name, cases in inputs.items():
+        fn = _load_target(root, name)
+        outputs = {case['id']: _normalise(fn(*case['args'])) for case in cases}
+
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for case in cases:
+                fn(*case['args'])
+            timings.append(time.perf_counter() - start)
+
+        tracemalloc.start()
+        for case in cases:
+            fn(*case['args'])
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        report[name] = {'outputs': outputs, 'timings': timings, 'peak_bytes': peak}
+
+    with open(out_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f)
+
+
+# ---------------------------------------------------------------------------
+# Orchestration
+
+
+def materialise_revision(rev: str, dest: Path) -> Path:
+    """Write the Python sources of a git revision into dest."""
+    listing = subprocess.run(['git', 'ls-tree', '-r', '--name-only', rev], cwd=REPO_ROOT,
+                             check=True, capture_output=True, text=True).stdout.split('\n')
+    for name in listing:
+        if not name.endswith('.py'):
+            continue
+        blob = subprocess.run(['git', 'show', f'{rev}:{name}'], cwd=REPO_ROOT, check=True, capture_output=True).stdout
+        target = dest / name
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(blob)
+    return dest
+
+
+def run_implementation(root: Path, inputs_path: Path, repeat: int, workdir: Path, label: str) -> dict:
+    out_path = workdir / f'{label}.json'
+    subprocess.run([sys.executable, str(Path(__file__).resolve()), '_worker', str(root),
+                    str(inputs_path), str(out_path), str(repeat)], check=True)
+    with open(out_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def merge_rounds(previous: dict, current: dict) -> dict:
+    """Keep the first round's outputs and pool timings across rounds."""
+    if previous is None:
+        return current
+    for name, result in current.items():
+        previous[name]['timings'].extend(result['timings'])
+        previous[name]['peak_bytes'] = min(previous[name]['peak_bytes'], result['peak_bytes'])
+    return previous
+
+
+def load_allow_list(path: Path) -> list:
+    if path is None:
+        return []
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def is_allowed(allow: list, target: str, case_id: str, field: str) -> bool:
+    """Allow-list entries: {"target", "id" (glob), "fields" (optional), "reason"}."""
+    for entry in allow:
+        if entry.get('target', target) != target:
+            continue
+        if not fnmatch.fnmatchcase(case_id, entry.get('id', '*')):
+            continue
+        if field in entry.get('fields', [field]):
+            return True
+    return False
+
+
+def diff_outputs(target: str, reference: dict, candidate: dict, allow: list, tolerance: float) -> list:
+    diffs = []
+    for case_id, ref in reference.items():
+        cand = candidate.get(case_id)
+        if cand is None:
+            diffs.append({'target': target, 'id': case_id, 'field': 'missing', 'reference': ref, 'candidate': None,
+                          'allowed': is_allowed(allow, target, case_id, 'missing')})
+            continue
+        for field in ('label', 'confidence', 'reasoning'):
+            a, b = ref[field], cand[field]
+            if field == 'confidence' and a is not None and b is not None:
+                same = abs(a - b) <= tolerance
+            else:
+                same = a == b
+            if not same:
+                diffs.append({'target': target, 'id': case_id, 'field': field, 'reference': a, 'candidate': b,
+                              'allowed': is_allowed(allow, target, case_id, field)})
+    return diffs
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == '_worker':
+        _, _, root, inputs_path, out_path, repeat = sys.argv
+        run_worker(Path(root), Path(inputs_path), Path(out_path), int(repeat))
+        return
+
+    parser = argparse.ArgumentParser(description='Gate classifier changes on identical output and no slowdown')
+    parser.add_argument('--reference-rev', default='HEAD', help='Git revision holding the reference implementation')
+    parser.add_argument('--reference-root', type=Path, help='Use a source tree instead of --reference-rev')
+    parser.add_argument('--candidate-root', type=Path, default=REPO_ROOT)
+    parser.add_argument('--targets', nargs='+', choices=sorted(TARGETS), default=sorted(TARGETS))
+    parser.add_argument('--batch-dir', type=Path, default=REPO_ROOT / 'sentiment_batches')
+    parser.add_argument('--fuzz', type=int, default=2, help='Fuzzed variants per input')
+    parser.add_argument('--seed', type=int, default=1234)
+    parser.add_argument('--repeat', type=int, default=3, help='Timed passes per worker round')
+    parser.add_argument('--rounds', type=int, default=3, help='Alternating worker runs per implementation')
+    parser.add_argument('--max-slowdown', type=float, default=0.10,
+                        help='Fail when candidate best time exceeds reference by this fraction')
+    parser.add_argument('--max-memory-growth', type=float, default=0.25,
+                        help='Fail when candidate peak memory exceeds reference by this fraction')
+    parser.add_argument('--memory-floor-kb', type=int, default=256,
+                        help='Ignore peak memory differences smaller than this')
+    parser.add_argument('--confidence-tolerance', type=float, default=0.0)
+    parser.add_argument('--allow', type=Path, help='JSON allow-list of expected differences')
+    parser.add_argument('--report', type=Path, help='Write every difference and measurement as JSON')
+    args = parser.parse_args()
+
+    mentions = load_mentions(args.batch_dir)
+    sentiment_data = (REPO_ROOT / 'sentimentData.ts').read_text(encoding='utf-8')
+    inputs = build_inputs(mentions, sentiment_data, args.fuzz, args.seed)
+    inputs = {name: inputs[name] for name in args.targets}
+    allow = load_allow_list(args.allow)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        inputs_path = workdir / 'inputs.json'
+        with open(inputs_path, 'w', encoding='utf-8') as f:
+            json.dump(inputs, f)
+
+        reference_root = args.reference_root or materialise_revision(args.reference_rev, workdir / 'reference')
+        print(f"Reference: {args.reference_root or args.reference_rev}   Candidate: {args.candidate_root}")
+        # Alternate rounds so drift in machine load hits both implementations alike
+        reference, candidate = None, None
+        for _ in range(args.rounds):
+            reference = merge_rounds(reference, run_implementation(
+                reference_root.resolve(), inputs_path, args.repeat, workdir, 'reference'))
+            candidate = merge_rounds(candidate, run_implementation(
+                args.candidate_root.resolve(), inputs_path, args.repeat, workdir, 'candidate'))
+
+    failed = False
+    report = {'targets': {}, 'diffs': []}
+    for name in args.targets:
+        ref, cand = reference[name], candidate[name]
+        diffs = diff_outputs(name, ref['outputs'], cand['outputs'], allow, args.confidence_tolerance)
+        blocking = [d for d in diffs if not d['allowed']]
+
+        # Best-of timings; slower passes measure interference, not the code
+        ref_time = min(ref['timings'])
+        cand_time = min(cand['timings'])
+        slowdown = cand_time / ref_time - 1 if ref_time else 0.0
+        memory_delta = cand['peak_bytes'] - ref['peak_bytes']
+        memory_growth = memory_delta / ref['peak_bytes'] if ref['peak_bytes'] else 0.0
+
+        too_slow = slowdown > args.max_slowdown
+        too_big = memory_growth > args.max_memory_growth and memory_delta > args.memory_floor_kb * 1024
+        target_failed = bool(blocking) or too_slow or too_big
+        failed = failed or target_failed
+
+        count = len(inputs[name])
+        print(f"\n=== {name} ({count} inputs) {'FAIL' if target_failed else 'PASS'} ===")
+        print(f"Differences: {len(diffs)} ({len(diffs) - len(blocking)} allowed)")
+        print(f"Throughput: reference {count / ref_time:,.0f}/s, candidate {count / cand_time:,.0f}/s "
+              f"({(ref_time / cand_time - 1) * 100:+.1f}%){'  <-- slower than allowed' if too_slow else ''}")
+        print(f"Peak memory: reference {ref['peak_bytes'] / 1024:,.0f} KiB, candidate {cand['peak_bytes'] / 1024:,.0f} KiB"
+              f"{'  <-- above allowed growth' if too_big else ''}")
+        for d in blocking[:5]:
+            print(f"  {d['id']} {d['field']}: {d['reference']!r} -> {d['candidate']!r}")
+        if len(blocking) > 5:
+            print(f"  ... {len(blocking) - 5} more")
+
+        report['targets'][name] = {
+            'inputs': count,
+            'differences': len(diffs),
+            'blocking': len(blocking),
+            'reference_best_s': ref_time,
+            'candidate_best_s': cand_time,
+            'slowdown': slowdown,
+            'reference_peak_bytes': ref['peak_bytes'],
+            'candidate_peak_bytes': cand['peak_bytes'],
+            'failed': target_failed,
+        }
+        report['diffs'].extend(diffs)
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\nReport saved to: {args.report}")
+
+    print(f"\nGate {'FAILED' if failed else 'PASSED'}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+Batch export of sentiment results for Convex import.
+Splits results into chunks sized for the parliamentAI:batchUpdateSentiments
+mutation, writes per-chunk checksums and a manifest, and uploads chunks in
+parallel with resumable progress tracking.
+
+Usage:
+    python scripts/convex_export.py build sentiment_batches/results_*.json --out convex_export
+    python scripts/convex_export.py upload convex_export --url https://<deployment>.convex.cloud
+    python scripts/convex_export.py serve --port 8787   # local stand-in endpoint for testing
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Make the shared sentiment_common package importable when run as a script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sentiment_common import lazy_import  # noqa: E402
+from sentiment_common.files import write_atomic  # noqa: E402
+from sentiment_common.results import iter_result_records  # noqa: E402
+
+# Network and server modules are only needed by the upload/serve commands
+urllib_request = lazy_import('urllib.request')
+urllib_error = lazy_import('urllib.error')
+futures = lazy_import('concurrent.futures')
+http_server = lazy_import('http.server')
+servers = lazy_import('sentiment_common.servers')
+
+MUTATION_PATH = 'parliamentAI:batchUpdateSentiments'
+
+# Convex caps array arguments at 8192 elements and total arguments at 8 MiB;
+# each update also costs one indexed read and one patch inside a single
+# transaction, so the defaults stay well below the hard limits.
+MAX_CONVEX_ARRAY_LENGTH = 8192
+DEFAULT_CHUNK_SIZE = 500
+DEFAULT_CHUNK_BYTES = 1024 * 1024
+
+VALID_SENTIMENTS = {'positive', 'neutral', 'negative', 'disregard'}
+
+
+def to_update(record: dict) -> dict:
+    """Convert a results record into a batchUpdateSentiments update object."""
+    sentiment = record['sentiment']
+    if sentiment not in VALID_SENTIMENTS:
+        raise ValueError(f"Unknown sentiment {sentiment!r} for {record.get('id')}")
+    return {
+        'contributionExtId': record['id'],
+        'sentiment': sentiment,
+        'sentimentConfidence': float(record.get('confidence', 0.0)),
+        'sentimentReasoning': record.get('reasoning', ''),
+    }
+
+
+def encode_chunk(updates: list[dict]) -> bytes:
+    """Serialize a chunk exactly as it is sent: the mutation's args object."""
+    return json.dumps({'updates': updates}, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def sha256_hex(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def build_export(inputs: list[Path], out_dir: Path, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> dict:
+    """Write chunk files and manifest.json for the given results files.
+
+    Records are de-duplicated by contribution ID; the last input that mentions
+    an ID wins, so later review passes override earlier ones.
+    """
+    chunk_size = min(chunk_size, MAX_CONVEX_ARRAY_LENGTH)
+    updates = {}
+    for path in inputs:
+        for record in iter_result_records(path):
+            update = to_update(record)
+            updates.pop(update['contributionExtId'], None)
+            updates[update['contributionExtId']] = update
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for stale in out_dir.glob('chunk_*.json'):
+        stale.unlink()
+
+    chunks = []
+    current = []
+    current_bytes = len(encode_chunk([]))
+
+    def flush():
+        nonlocal current, current_bytes
+        if not current:
+            return
+        data = encode_chunk(current)
+        name = f'chunk_{len(chunks) + 1:04d}.json'
+        write_atomic(out_dir / name, data)
+        chunks.append({
+            'file': name,
+            'count': len(current),
+            'bytes': len(data),
+            'sha256': sha256_hex(data),
+            'firstId': current[0]['contributionExtId'],
+            'lastId': current[-1]['contributionExtId'],
+        })
+        current = []
+        current_bytes = len(encode_chunk([]))
+
+    for update in updates.values():
+        size = len(json.dumps(update, ensure_ascii=False, separators=(',', ':')).encode('utf-8')) + 1
+        if size > chunk_bytes:
+            raise ValueError(f"Update for {update['contributionExtId']} exceeds chunk byte limit")
+        if current and (len(current) >= chunk_size or current_bytes + size > chunk_bytes):
+            flush()
+        current.append(update)
+        current_bytes += size
+    flush()
+
+    manifest = {
+        'mutation': MUTATION_PATH,
+        'createdAt': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'sources': [str(p) for p in inputs],
+        'total': len(updates),
+        'chunkSize': chunk_size,
+        'chunkBytes': chunk_bytes,
+        'chunks': chunks,
+    }
+    write_atomic(out_dir / 'manifest.json', json.dumps(manifest, indent=2).encode('utf-8'))
+    return manifest
+
+
+class UploadState:
+    """Tracks uploaded chunk checksums in upload_state.json so runs can resume."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.done = {}
+        if path.exists():
+            self.done = json.loads(path.read_text(encoding='utf-8')).get('done', {})
+
+    def is_done(self, chunk: dict) -> bool:
+        return self.done.get(chunk['file']) == chunk['sha256']
+
+    def mark_done(self, chunk: dict):
+        with self.lock:
+            self.done[chunk['file']] = chunk['sha256']
+            write_atomic(self.path, json.dumps({'done': self.done}, indent=2).encode('utf-8'))
+
+
+class MutationError(RuntimeError):
+    """A rejected mutation call; retryable is False when resending cannot help."""
+
+    def __init__(self, message: str, retryable: bool = False):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+def error_message(error) -> str:
+    """Convex reports failures as {"status": "error", "errorMessage": ...} bodies."""
+    try:
+        return json.loads(error.read()).get('errorMessage') or error.reason
+    except (OSError, ValueError, AttributeError):
+        return error.reason
+
+
+def post_chunk(url: str, data: bytes, token: str = None, timeout: float = 60.0) -> dict:
+    """Call the mutation through Convex's HTTP API and return its value."""
+    body = json.dumps({
+        'path': MUTATION_PATH,
+        'args': json.loads(data),
+        'format': 'json',
+    }).encode('utf-8')
+    headers = {'Content-Type': 'application/json'}
+    if token:
+        headers['Authorization'] = f'Convex {token}'
+    request = urllib_request.Request(url.rstrip('/') + '/api/mutation', data=body, headers=headers, method='POST')
+    try:
+        with urllib_request.urlopen(request, timeout=timeout) as response:
+            payload = json.loads(response.read())
+    except urllib_error.HTTPError as e:
+        # 4xx means the request itself was rejected (bad args, auth, unknown
+        # function), so only server-side failures are worth resending
+        raise MutationError(f'HTTP {e.code}: {error_message(e)}', retryable=e.code >= 500) from None
+    if payload.get('status') != 'success':
+        raise MutationError(payload.get('errorMessage', 'mutation failed'))
+    return payload.get('value') or {}
+
+
+def upload_export(export_dir: Path, url: str, token: str = None, workers: int = 4,
+                  retries: int = 3) -> dict:
+    """Upload every chunk not yet recorded in the state file, in parallel."""
+    manifest = json.loads((export_dir / 'manifest.json').read_text(encoding='utf-8'))
+    state = UploadState(export_dir / 'upload_state.json')
+    pending = [c for c in manifest['chunks'] if not state.is_done(c)]
+    stats = {'skipped': len(manifest['chunks']) - len(pending), 'uploaded': 0, 'failed': 0, 'updated': 0}
+
+    def send(chunk: dict) -> int:
+        data = (export_dir / chunk['file']).read_bytes()
+        if sha256_hex(data) != chunk['sha256']:
+            raise ValueError(f"Checksum mismatch for {chunk['file']}; rebuild the export")
+        for attempt in range(retries + 1):
+            try:
+                value = post_chunk(url, data, token)
+                break
+            except (MutationError, urllib_error.URLError, TimeoutError, ConnectionError) as e:
+                if attempt == retries or (isinstance(e, MutationError) and not e.retryable):
+                    raise
+                delay = 2 ** attempt + random.random()
+                print(f"Retrying {chunk['file']} in {delay:.1f}s: {e}")
+                time.sleep(delay)
+        state.mark_done(chunk)
+        return value.get('updated', 0)
+
+    with futures.ThreadPoolExecutor(max_workers=workers) as pool:
+        submitted = {pool.submit(send, chunk): chunk for chunk in pending}
+        for future in futures.as_completed(submitted):
+            chunk = submitted[future]
+            try:
+                stats['updated'] += future.result()
+                stats['uploaded'] += 1
+                print(f"Uploaded {chunk['file']} ({chunk['count']} updates)")
+            except Exception as e:
+                stats['failed'] += 1
+                print(f"Failed {chunk['file']}: {e}")
+
+    return stats
+
+
+def make_stand_in_server(port: int, received_path: Path, fail_rate: float = 0.0):
+    """Minimal local stand-in for the Convex HTTP mutation endpoint."""
+    lock = threading.Lock()
+
+    class StandInHandler(http_server.BaseHTTPRequestHandler):
+        def do_POST(self):
+            if self.path != '/api/mutation':
+                self.send_error(404)
+                return
+            body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+            if random.random() < fail_rate:
+                self._reply(500, {'status': 'error', 'errorMessage': 'Injected failure'})
+                return
+            if body.get('path') != MUTATION_PATH:
+                self._reply(400, {'status': 'error', 'errorMessage': f"Unknown function {body.get('path')}"})
+                return
+            updates = body.get('args', {}).get('updates', [])
+            if len(updates) > MAX_CONVEX_ARRAY_LENGTH:
+                self._reply(400, {'status': 'error', 'errorMessage': 'Array too long'})
+                return
+            with lock, open(received_path, 'a', encoding='utf-8') as f:
+                for update in updates:
+                    f.write(json.dumps(update) + '\n')
+            self._reply(200, {'status': 'success', 'value': {'updated': len(updates)}})
+
+        def _reply(self, code: int, payload: dict):
+            data = json.dumps(payload).encode('utf-8')
+            self.send_response(code)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    return servers.StandInServer(('127.0.0.1', port), StandInHandler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build and upload Convex sentiment import chunks')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    build = sub.add_parser('build', help='Chunk results files and write a manifest')
+    build.add_argument('inputs', nargs='+', type=Path)
+    build.add_argument('--out', type=Path, default=Path('convex_export'))
+    build.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    build.add_argument('--chunk-bytes', type=int, default=DEFAULT_CHUNK_BYTES)
+
+    upload = sub.add_parser('upload', help='Upload pending chunks from an export directory')
+    upload.add_argument('export_dir', type=Path)
+    upload.add_argument('--url', default=os.environ.get('CONVEX_URL') or os.environ.get('VITE_CONVEX_URL'))
+    upload.add_argument('--token', default=os.environ.get('CONVEX_DEPLOY_KEY'))
+    upload.add_argument('--workers', type=int, default=4)
+    upload.add_argument('--retries', type=int, default=3)
+
+    serve = sub.add_parser('serve', help='Run a local stand-in mutation endpoint')
+    serve.add_argument('--port', type=int, default=8787)
+    serve.add_argument('--received', type=Path, default=Path('convex_received.jsonl'))
+    serve.add_argument('--fail-rate', type=float, default=0.0)
+
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        manifest = build_export(args.inputs, args.out, args.chunk_size, args.chunk_bytes)
+        print(f"Wrote {len(manifest['chunks'])} chunks ({manifest['total']} updates) to {args.out}")
+    elif args.command == 'upload':
+        if not args.url:
+            parser.error('--url (or CONVEX_URL) is required')
+        stats = upload_export(args.export_dir, args.url, args.token, args.workers, args.retries)
+        print(f"\nUploaded: {stats['uploaded']}  Skipped: {stats['skipped']}  "
+              f"Failed: {stats['failed']}  Mentions updated: {stats['updated']}")
+        if stats['failed']:
+            raise SystemExit(1)
+    else:
+        server = make_stand_in_server(args.port, args.received, args.fail_rate)
+        print(f"Stand-in endpoint listening on http://127.0.0.1:{args.port}")
+        server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Extract per-page text from government PDFs into *.pages.json corpora.
+Pages are extracted in parallel across a process pool, whitespace and
+hyphenation are normalised, records are written as they arrive, and
+documents whose PDF hash has not changed since the last run are skipped.
+
+Requires pypdf (pip install pypdf).
+
+Usage:
+    python scripts/extract_pdf_pages.py
+    python scripts/extract_pdf_pages.py new_document.pdf --workers 8
+    python scripts/extract_pdf_pages.py --force
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Make the shared sentiment_common package importable when run as a script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sentiment_common import lazy_import  # noqa: E402
+from sentiment_common.files import atomic_open  # noqa: E402
+
+pypdf = lazy_import('pypdf')
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+DEFAULT_PDFS = [
+    'ai_opportunities_action_plan.pdf',
+    'government_response.pdf',
+    'aigoogledoc.pdf',
+]
+
+MANIFEST_NAME = 'pdf_pages_manifest.json'
+
+# Compounds broken across lines as "well-\nestablished" keep their hyphen,
+# since a printed hyphen at a line end is part of the word in these documents;
+# only joined when the continuation starts in lower case, so list items like
+# "- \nThe" survive
+HYPHEN_BREAK = re.compile(r'(\w)-\n(?=[a-z])')
+# Soft hyphens only mark where a word may break and are dropped
+SOFT_HYPHEN_BREAK = re.compile(r'(\w)\u00ad\n(?=[a-z])')
+SOFT_HYPHEN = re.compile('\u00ad')
+INLINE_SPACE = re.compile(r'[ \t\u00a0\u2009\u202f]+')
+BLANK_RUN = re.compile(r'\n{3,}')
+
+
+def normalise_text(text: str) -> str:
+    """Trim padding lines and spaces, collapse blank runs and rejoin hyphenated words."""
+    text = text.replace('\r\n', '\n').replace('\r', '\n')
+    lines = [INLINE_SPACE.sub(' ', line).strip() for line in text.split('\n')]
+    text = '\n'.join(lines)
+    text = HYPHEN_BREAK.sub(r'\1-', text)
+    text = SOFT_HYPHEN_BREAK.sub(r'\1', text)
+    text = SOFT_HYPHEN.sub('', text)
+    return BLANK_RUN.sub('\n\n', text).strip()
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+# Per-process reader cache so each worker parses a document's xref table once
+_readers = {}
+
+
+def _extract_page(task: tuple) -> dict:
+    path, index = task
+    reader = _readers.get(path)
+    if reader is None:
+        reader = pypdf.PdfReader(path)
+        _readers[path] = reader
+    text = reader.pages[index].extract_text() or ''
+    return {'page': index + 1, 'text': normalise_text(text)}
+
+
+def page_record_json(record: dict) -> str:
+    """Format one record exactly as json.dump(pages, indent=2) would nest it."""
+    body = json.dumps(record, indent=2, ensure_ascii=False)
+    return '\n'.join('  ' + line for line in body.split('\n'))
+
+
+def extract_document(pdf_path: Path, out_path: Path, pool: ProcessPoolExecutor, workers: int) -> int:
+    """Extract all pages of pdf_path to out_path, writing each page as it completes."""
+    page_count = len(pypdf.PdfReader(str(pdf_path)).pages)
+    tasks = [(str(pdf_path), i) for i in range(page_count)]
+    chunksize = max(1, page_count // (4 * workers))
+
+    with atomic_open(out_path) as f:
+        f.write('[\n')
+        # map preserves page order while later pages are still being extracted
+        for i, record in enumerate(pool.map(_extract_page, tasks, chunksize=chunksize)):
+            if i:
+                f.write(',\n')
+            f.write(page_record_json(record))
+            f.flush()
+        f.write('\n]')
+    return page_count
+
+
+def load_manifest(path: Path) -> dict:
+    if path.exists():
+        return json.loads(path.read_text(encoding='utf-8'))
+    return {}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Extract PDF pages into *.pages.json files')
+    parser.add_argument('pdfs', nargs='*', type=Path, help='PDFs to extract (default: the tracked documents)')
+    parser.add_argument('--out-dir', type=Path, default=None,
+                        help='Directory for *.pages.json output (default: next to each PDF)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--force', action='store_true', help='Re-extract even when the PDF hash is unchanged')
+    args = parser.parse_args()
+
+    pdfs = args.pdfs or [REPO_ROOT / name for name in DEFAULT_PDFS]
+    manifest_path = (args.out_dir or REPO_ROOT) / MANIFEST_NAME
+    manifest = load_manifest(manifest_path)
+
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        for pdf_path in pdfs:
+            if not pdf_path.exists():
+                print(f'Skipping {pdf_path}: not found')
+                continue
+            out_path = (args.out_dir or pdf_path.parent) / f'{pdf_path.stem}.pages.json'
+            digest = file_sha256(pdf_path)
+            key = pdf_path.name
+
+            if not args.force and manifest.get(key, {}).get('sha256') == digest and out_path.exists():
+                print(f'Unchanged: {pdf_path.name}')
+                continue
+
+            print(f'Extracting {pdf_path.name}...')
+            pages = extract_document(pdf_path, out_path, pool, args.workers)
+            manifest[key] = {'sha256': digest, 'pages': pages, 'output': out_path.name}
+
+            # Saved per document so an interrupted batch keeps finished work
+            with atomic_open(manifest_path) as f:
+                json.dump(manifest, f, indent=2)
+            print(f'  {pages} pages saved to: {out_path}')
+
+
+if __name__ == '__main__':
+    main()
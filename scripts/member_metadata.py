@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Member and party metadata for offline enrichment of Parliament AI mentions.
+Resolves member IDs against the Members API (or any compatible endpoint) in
+de-duplicated concurrent batches, keeps results in a local cache with a TTL,
+and serves lookups from memory, so re-enriching the corpus is a cache-hit pass.
+
+Usage:
+    python scripts/member_metadata.py resolve 4888 172 4514
+    python scripts/member_metadata.py enrich sentiment_batches/batch_*.json --out enriched/
+    python scripts/member_metadata.py serve --port 8788   # local stand-in built from batch files
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+# Make the shared sentiment_common package importable when run as a script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sentiment_common import lazy_import  # noqa: E402
+from sentiment_common.files import atomic_open  # noqa: E402
+
+urllib_request = lazy_import('urllib.request')
+urllib_error = lazy_import('urllib.error')
+futures = lazy_import('concurrent.futures')
+http_client = lazy_import('http.client')
+http_server = lazy_import('http.server')
+servers = lazy_import('sentiment_common.servers')
+
+DEFAULT_ENDPOINT = 'https://members-api.parliament.uk'
+CACHE_PATH = Path('sentiment_batches/member_cache.json')
+
+DEFAULT_TTL = 30 * 24 * 3600
+# Misses are retried sooner in case the API was briefly unavailable
+NEGATIVE_TTL = 24 * 3600
+
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_WORKERS = 8
+
+
+def party_from_member(data: dict) -> Optional[dict]:
+    """Extract latestParty the same way convex/hansard.ts fetchMemberParty does."""
+    party = (data.get('value') or {}).get('latestParty')
+    if not party:
+        return None
+    return {
+        'id': party.get('id'),
+        'name': party['name'],
+        'abbreviation': party.get('abbreviation') or party['name'][:3],
+        # API returns colour without # prefix
+        'backgroundColour': f"#{party['backgroundColour']}" if party.get('backgroundColour') else '#888888',
+    }
+
+
+def mention_party(party: dict) -> dict:
+    """Shape a resolved party like the party field stored on mentions."""
+    return {
+        'abbreviation': party['abbreviation'],
+        'colour': party['backgroundColour'],
+        'name': party['name'],
+    }
+
+
+class MemberMetadataStore:
+    """
+    In-memory member → party map backed by a JSON cache file.
+
+    Entries older than their TTL are treated as missing and re-resolved on the
+    next resolve() call; lookups never touch the network.
+    """
+
+    def __init__(self, cache_path: Path = CACHE_PATH, endpoint: str = DEFAULT_ENDPOINT,
+                 ttl: int = DEFAULT_TTL, negative_ttl: int = NEGATIVE_TTL, timeout: float = 15.0):
+        self.cache_path = cache_path
+        self.endpoint = endpoint.rstrip('/')
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.timeout = timeout
+        self.lock = threading.Lock()
+        self.entries: Dict[str, dict] = {}
+        if cache_path.exists():
+            self.entries = json.loads(cache_path.read_text(encoding='utf-8'))
+
+    def _fresh(self, entry: Optional[dict], now: float) -> bool:
+        if entry is None:
+            return False
+        ttl = self.ttl if entry['party'] is not None else self.negative_ttl
+        return now - entry['fetchedAt'] < ttl
+
+    def lookup(self, member_id: int) -> Optional[dict]:
+        entry = self.entries.get(str(member_id))
+        return entry['party'] if entry else None
+
+    def fetch_member(self, member_id: int) -> Optional[dict]:
+        url = f'{self.endpoint}/api/Members/{member_id}'
+        request = urllib_request.Request(url, headers={'Accept': 'application/json'})
+        try:
+            with urllib_request.urlopen(request, timeout=self.timeout) as response:
+                return party_from_member(json.loads(response.read()))
+        except urllib_error.HTTPError as e:
+            if e.code == 404:
+                return None
+            raise
+
+    def resolve(self, member_ids: Iterable[int], batch_size: int = DEFAULT_BATCH_SIZE,
+                workers: int = DEFAULT_WORKERS) -> dict:
+        """
+        Make sure every member ID has a fresh cache entry.
+
+        IDs are de-duplicated and fetched concurrently a batch at a time; the
+        cache file is saved after each batch so interrupted runs keep progress.
+        Returns counts of hits, fetched entries and errors.
+        """
+        now = time.time()
+        unique = sorted({int(m) for m in member_ids if m is not None})
+        missing = [m for m in unique if not self._fresh(self.entries.get(str(m)), now)]
+        stats = {'hits': len(unique) - len(missing), 'fetched': 0, 'errors': 0}
+
+        with futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            for start in range(0, len(missing), batch_size):
+                batch = missing[start:start + batch_size]
+                submitted = {pool.submit(self.fetch_member, m): m for m in batch}
+                for future in futures.as_completed(submitted):
+                    member_id = submitted[future]
+                    try:
+                        party = future.result()
+                    # OSError covers URLError, timeouts and connection resets;
+                    # HTTPException covers RemoteDisconnected and bad status lines
+                    except (OSError, http_client.HTTPException, ValueError) as e:
+                        print(f'Failed to fetch member {member_id}: {e}')
+                        stats['errors'] += 1
+                        continue
+                    with self.lock:
+                        self.entries[str(member_id)] = {'party': party, 'fetchedAt': time.time()}
+                    stats['fetched'] += 1
+                self.save()
+
+        return stats
+
+    def enrich(self, mentions: Iterable[dict]) -> int:
+        """Set the party field on mentions from the cache. Returns mentions updated."""
+        updated = 0
+        for mention in mentions:
+            party = self.lookup(mention.get('memberId'))
+            if party is not None:
+                mention['party'] = mention_party(party)
+                updated += 1
+        return updated
+
+    def save(self):
+        with self.lock, atomic_open(self.cache_path) as f:
+            json.dump(self.entries, f, indent=2)
+
+
+def fixture_from_batches(paths: Iterable[Path]) -> Dict[int, dict]:
+    """Build Members API style responses from the parties already on mentions."""
+    members = {}
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            for mention in json.load(f):
+                party = mention.get('party')
+                if mention.get('memberId') is None or not party:
+                    continue
+                members[mention['memberId']] = {'value': {
+                    'id': mention['memberId'],
+                    'nameDisplayAs': mention.get('memberName'),
+                    'latestParty': {
+                        'name': party['name'],
+                        'abbreviation': party.get('abbreviation'),
+                        'backgroundColour': (party.get('colour') or '').lstrip('#') or None,
+                    },
+                }}
+    return members
+
+
+def make_stand_in_server(port: int, members: Dict[int, dict]):
+    """Local stand-in for GET /api/Members/{id} serving fixture data."""
+
+    class StandInHandler(http_server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            prefix = '/api/Members/'
+            member = None
+            if self.path.startswith(prefix) and self.path[len(prefix):].isdigit():
+                member = members.get(int(self.path[len(prefix):]))
+            if member is None:
+                self.send_error(404)
+                return
+            data = json.dumps(member).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    return servers.StandInServer(('127.0.0.1', port), StandInHandler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Resolve and cache member party metadata')
+    parser.add_argument('--cache', type=Path, default=CACHE_PATH)
+    parser.add_argument('--endpoint', default=os.environ.get('MEMBERS_API_URL', DEFAULT_ENDPOINT))
+    parser.add_argument('--ttl', type=int, default=DEFAULT_TTL, help='Cache lifetime in seconds')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS)
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    resolve = sub.add_parser('resolve', help='Resolve member IDs and print their parties')
+    resolve.add_argument('member_ids', nargs='+', type=int)
+
+    enrich = sub.add_parser('enrich', help='Resolve and set party metadata on mention batch files')
+    enrich.add_argument('batches', nargs='+', type=Path)
+    enrich.add_argument('--out', type=Path, required=True, help='Directory for enriched batch files')
+
+    serve = sub.add_parser('serve', help='Run a local stand-in Members API')
+    serve.add_argument('--port', type=int, default=8788)
+    serve.add_argument('--from-batches', nargs='+', type=Path,
+                       default=sorted(Path('sentiment_batches').glob('batch_*.json')))
+
+    args = parser.parse_args()
+
+    if args.command == 'serve':
+        members = fixture_from_batches(args.from_batches)
+        server = make_stand_in_server(args.port, members)
+        print(f'Stand-in Members API with {len(members)} members on http://127.0.0.1:{args.port}')
+        server.serve_forever()
+        return
+
+    store = MemberMetadataStore(args.cache, args.endpoint, args.ttl)
+
+    if args.command == 'resolve':
+        stats = store.resolve(args.member_ids, args.batch_size, args.workers)
+        for member_id in dict.fromkeys(args.member_ids):
+            party = store.lookup(member_id)
+            print(f"{member_id}: {party['name'] if party else 'unknown'}")
+    else:
+        batches = []
+        for path in args.batches:
+            with open(path, 'r', encoding='utf-8') as f:
+                batches.append((path, json.load(f)))
+        stats = store.resolve((m.get('memberId') for _, mentions in batches for m in mentions),
+                              args.batch_size, args.workers)
+        args.out.mkdir(parents=True, exist_ok=True)
+        updated = 0
+        for path, mentions in batches:
+            updated += store.enrich(mentions)
+            with open(args.out / path.name, 'w', encoding='utf-8') as f:
+                json.dump(mentions, f, indent=2, ensure_ascii=False)
+        print(f'Enriched {updated} mentions into {args.out}')
+
+    print(f"Cache hits: {stats['hits']}  Fetched: {stats['fetched']}  Errors: {stats['errors']}")
+
+
+if __name__ == '__main__':
+    main()
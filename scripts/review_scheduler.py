@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Confidence-driven scheduling of sentiment review batches.
+Ranks mentions by classifier uncertainty and disagreement between labels,
+emits review batches sized by an estimated token budget instead of a fixed
+count, and merges returned results_*.json files incrementally.
+
+Usage:
+    python scripts/review_scheduler.py plan sentiment_batches/batch_*.json \
+        --reference sentiment_batches/results_*.json --budget-tokens 6000 --max-batches 10
+    python scripts/review_scheduler.py merge sentiment_batches/results_*.json
+"""
+
+import argparse
+import hashlib
+import heapq
+import json
+import sys
+from pathlib import Path
+from typing import Iterable, NamedTuple
+
+# Make the shared sentiment_common package importable when run as a script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sentiment_analysis import classify_sentiment, is_false_positive  # noqa: E402
+from sentiment_common.files import atomic_open  # noqa: E402
+from sentiment_common.results import iter_result_records  # noqa: E402
+
+REVIEW_DIR = Path('sentiment_batches/review')
+MERGED_PATH = Path('sentiment_batches/reviewed_results.json')
+
+# Rough English average for LLM tokenisers
+CHARS_PER_TOKEN = 4
+# Field names, IDs and party metadata that travel with every mention
+MENTION_OVERHEAD_TOKENS = 60
+
+DISAGREEMENT_WEIGHT = 0.5
+
+
+class ReviewItem(NamedTuple):
+    priority: float
+    ext_id: str
+    tokens: int
+    classifier: str
+    confidence: float
+    labels: tuple
+
+
+def estimate_tokens(mention: dict) -> int:
+    chars = len(mention.get('contextText', '')) + len(mention.get('debateTitle', ''))
+    return chars // CHARS_PER_TOKEN + MENTION_OVERHEAD_TOKENS
+
+
+def classify_mention(mention: dict) -> tuple[str, float]:
+    """Run the keyword classifier the same way scripts/sentiment_analysis.py does."""
+    context = mention.get('contextText', '')
+    if mention.get('mentionType', 'AI') == 'AI' and is_false_positive(context):
+        return 'disregard', 0.9
+    sentiment, confidence, _ = classify_sentiment(context, mention.get('debateTitle', ''))
+    return sentiment, round(confidence, 2)
+
+
+def load_labels(paths: Iterable[Path]) -> dict:
+    """Map contribution ID to every (sentiment, confidence) recorded for it."""
+    labels = {}
+    for path in paths:
+        for record in iter_result_records(path):
+            labels.setdefault(record['id'], []).append((record['sentiment'], float(record.get('confidence', 0.0))))
+    return labels
+
+
+def score(classifier: str, confidence: float, references: list) -> tuple[float, tuple]:
+    """Higher scores mean a review is more likely to change the outcome."""
+    labels = {classifier} | {label for label, _ in references}
+    lowest = min([confidence] + [c for _, c in references])
+    return (1.0 - lowest) + DISAGREEMENT_WEIGHT * (len(labels) - 1), tuple(sorted(labels))
+
+
+class ReviewScheduler:
+    def __init__(self, review_dir: Path = REVIEW_DIR):
+        self.review_dir = review_dir
+        self.state_path = review_dir / 'schedule_state.json'
+        self.state = {'batches': {}, 'next_batch': 1}
+        if self.state_path.exists():
+            self.state = json.loads(self.state_path.read_text(encoding='utf-8'))
+
+    def pending_ids(self) -> set:
+        return {ext_id for batch in self.state['batches'].values() for ext_id in batch['ids']}
+
+    def build_queue(self, mentions: Iterable[dict], references: dict, skip: set) -> list:
+        """Heap of ReviewItems keyed on negative priority, so pops come out most-uncertain first."""
+        heap = []
+        for mention in mentions:
+            ext_id = mention['contributionExtId']
+            if ext_id in skip:
+                continue
+            classifier, confidence = classify_mention(mention)
+            priority, labels = score(classifier, confidence, references.get(ext_id, []))
+            item = ReviewItem(priority, ext_id, estimate_tokens(mention), classifier, confidence, labels)
+            heapq.heappush(heap, (-priority, ext_id, item))
+        return heap
+
+    def plan(self, mentions: list, references: dict, reviewed: set, budget_tokens: int,
+             max_batches: int, min_priority: float = 0.0) -> list:
+        """Emit up to max_batches review batch files and return their summaries."""
+        by_id = {m['contributionExtId']: m for m in mentions}
+        heap = self.build_queue(mentions, references, reviewed | self.pending_ids())
+        self.review_dir.mkdir(parents=True, exist_ok=True)
+
+        emitted = []
+        while heap and len(emitted) < max_batches:
+            batch, used = [], 0
+            while heap:
+                item = heap[0][2]
+                if item.priority < min_priority:
+                    heap = []
+                    break
+                # Always take at least one mention so oversized ones still get scheduled
+                if batch and used + item.tokens > budget_tokens:
+                    break
+                heapq.heappop(heap)
+                batch.append(item)
+                used += item.tokens
+            if not batch:
+                break
+
+            number = self.state['next_batch']
+            self.state['next_batch'] += 1
+            name = f'review_{number:03d}.json'
+            with open(self.review_dir / name, 'w', encoding='utf-8') as f:
+                json.dump([by_id[item.ext_id] for item in batch], f, indent=2, ensure_ascii=False)
+
+            summary = {
+                'file': name,
+                'ids': [item.ext_id for item in batch],
+                'estimatedTokens': used,
+                'maxPriority': round(batch[0].priority, 3),
+                'minPriority': round(batch[-1].priority, 3),
+            }
+            self.state['batches'][name] = summary
+            emitted.append(summary)
+
+        self._save()
+        return emitted
+
+    def complete(self, reviewed: set):
+        """Drop batches whose mentions have all come back reviewed."""
+        self.state['batches'] = {
+            name: batch for name, batch in self.state['batches'].items()
+            if not set(batch['ids']) <= reviewed
+        }
+        self._save()
+
+    def _save(self):
+        with atomic_open(self.state_path) as f:
+            json.dump(self.state, f, indent=2)
+
+
+def file_digest(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def merge_results(paths: list[Path], merged_path: Path = MERGED_PATH) -> tuple[int, int]:
+    """
+    Fold results files into merged_path, skipping files merged before unchanged.
+
+    Later files override earlier labels for the same ID. Sources keep the
+    order they were first merged in, with new files appended in argument
+    order. New files are folded on top of the existing merge, but if a file
+    merged before has changed, every source is replayed in order so it cannot
+    override files that came after it. Returns (files merged, records merged).
+    """
+    state_path = merged_path.with_name(merged_path.stem + '_sources.json')
+    sources = json.loads(state_path.read_text(encoding='utf-8')) if state_path.exists() else {}
+
+    changed = False
+    new = []
+    for path in paths:
+        digest = file_digest(path)
+        previous = sources.get(str(path))
+        if previous is None:
+            new.append(path)
+        elif previous != digest:
+            changed = True
+        sources[str(path)] = digest
+
+    merged = {}
+    if changed:
+        # Sources whose files have since been removed drop out of the replay
+        fold = [Path(name) for name in sources if Path(name).exists()]
+        sources = {str(path): sources[str(path)] for path in fold}
+    else:
+        if merged_path.exists():
+            merged = {r['id']: r for r in json.loads(merged_path.read_text(encoding='utf-8'))}
+        fold = new
+
+    records = 0
+    for path in fold:
+        for record in iter_result_records(path):
+            merged[record['id']] = record
+            records += 1
+
+    if fold:
+        for target, data in ((merged_path, list(merged.values())), (state_path, sources)):
+            with atomic_open(target) as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+    return len(fold), records
+
+
+def load_reviewed(merged_path: Path = MERGED_PATH) -> set:
+    if not merged_path.exists():
+        return set()
+    return {r['id'] for r in json.loads(merged_path.read_text(encoding='utf-8'))}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Schedule sentiment review batches by uncertainty')
+    parser.add_argument('--review-dir', type=Path, default=REVIEW_DIR)
+    parser.add_argument('--merged', type=Path, default=MERGED_PATH)
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    plan = sub.add_parser('plan', help='Emit the next review batches')
+    plan.add_argument('batches', nargs='+', type=Path)
+    plan.add_argument('--reference', nargs='*', type=Path, default=[],
+                      help='Existing results files whose labels count towards disagreement')
+    plan.add_argument('--budget-tokens', type=int, default=6000)
+    plan.add_argument('--max-batches', type=int, default=5)
+    plan.add_argument('--min-priority', type=float, default=0.0)
+
+    merge = sub.add_parser('merge', help='Merge returned results files')
+    merge.add_argument('results', nargs='+', type=Path)
+
+    args = parser.parse_args()
+    scheduler = ReviewScheduler(args.review_dir)
+
+    if args.command == 'plan':
+        mentions = []
+        for path in args.batches:
+            with open(path, 'r', encoding='utf-8') as f:
+                mentions.extend(json.load(f))
+        emitted = scheduler.plan(mentions, load_labels(args.reference), load_reviewed(args.merged),
+                                 args.budget_tokens, args.max_batches, args.min_priority)
+        for batch in emitted:
+            print(f"{batch['file']}: {len(batch['ids'])} mentions, ~{batch['estimatedTokens']} tokens, "
+                  f"priority {batch['maxPriority']}-{batch['minPriority']}")
+        print(f'\nEmitted {len(emitted)} batches to {args.review_dir}')
+    else:
+        files, records = merge_results(args.results, args.merged)
+        scheduler.complete(load_reviewed(args.merged))
+        print(f'Merged {records} records from {files} new or changed files into {args.merged}')
+
+
+if __name__ == '__main__':
+    main()
@@ -4,77 +4,37 @@ Sentiment analysis for Parliament AI mentions using keyword/pattern analysis.
 Processes all 40 batches and outputs results for Convex import.
 """
 
-import json
-import os
-import re
+import sys
 from pathlib import Path
 
-# False positive patterns (Hansard API highlighting artifacts)
-FALSE_POSITIVE_PATTERNS = [
-    r'\b(pr|f|m|aw|ch|s|tr|pl|r|cl|str|br|afr|obt|st|dr|gr|upl|sl|p|w|restr|ent|ret|sust|rem|det|expl|att|cert|m)[\s]?ai[\s]?(se|n|m|d|t|r|l|ned|nt|ns|ning|ned|der|rman|rmanship|nst|led|ling|ls)\b',
-    r'\bai[\s]?m\b',  # aim
-    r'\bs[\s]?ai[\s]?d\b',  # said
-    r'\bch[\s]?ai[\s]?r\b',  # chair
-    r'\bpr[\s]?ai[\s]?se\b',  # praise
-    r'\bm[\s]?ai[\s]?den\b',  # maiden
-    r'\bAff[\s]?ai[\s]?rs\b',  # Affairs
-    r'\brem[\s]?ai[\s]?n\b',  # remain
-    r'\bobt[\s]?ai[\s]?n\b',  # obtain
-    r'\bcont[\s]?ai[\s]?n\b',  # contain
-    r'\bsust[\s]?ai[\s]?n\b',  # sustain
-    r'\bdet[\s]?ai[\s]?l\b',  # detail
-]
+# Make the shared sentiment_common package importable when run as a script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-# Keywords for sentiment classification
-POSITIVE_KEYWORDS = [
-    'opportunity', 'opportunities', 'benefit', 'benefits', 'potential',
-    'innovation', 'innovative', 'progress', 'advancement', 'growth',
-    'support', 'supporting', 'welcome', 'welcomed', 'exciting',
-    'transform', 'transformative', 'improve', 'improvement', 'enhance',
-    'enable', 'enabling', 'empower', 'productivity', 'efficiency',
-    'breakthrough', 'promising', 'optimistic', 'lead', 'leadership',
-    'invest', 'investment', 'boost', 'advantage', 'advantageous'
-]
+from sentiment_common.lexicons import (  # noqa: E402  re-exported for existing callers
+    FALSE_POSITIVE_PATTERNS, NEGATIVE_KEYWORDS, NEUTRAL_KEYWORDS, POSITIVE_KEYWORDS,
+)
+from sentiment_common import lazy_import, matchers  # noqa: E402
 
-NEGATIVE_KEYWORDS = [
-    'risk', 'risks', 'danger', 'dangerous', 'threat', 'concern', 'concerned',
-    'worry', 'worried', 'fear', 'fears', 'problem', 'problems', 'challenge',
-    'harmful', 'harm', 'damage', 'unsafe', 'unsafe', 'regulate', 'regulation',
-    'bias', 'biased', 'discrimination', 'discriminatory', 'unemployment',
-    'job loss', 'job losses', 'replace', 'replacement', 'displace',
-    'misinformation', 'disinformation', 'deepfake', 'deepfakes',
-    'surveillance', 'privacy', 'unethical', 'ethical concerns',
-    'safeguard', 'safeguards', 'protect', 'protection', 'caution', 'cautious'
-]
-
-NEUTRAL_KEYWORDS = [
-    'question', 'questions', 'ask', 'asking', 'inquiry', 'review',
-    'committee', 'report', 'statement', 'update', 'minister', 'secretary',
-    'policy', 'legislation', 'bill', 'amendment', 'debate', 'discussion',
-    'consider', 'considering', 'examine', 'examining', 'assess', 'assessment'
-]
+# Only the batch runner reads and writes JSON; importing the classifier skips it
+json = lazy_import('json')
 
 
 def is_false_positive(context_text: str) -> bool:
     """Check if the mention is a false positive (not about AI)."""
+    patterns = matchers.get_patterns()
     text_lower = context_text.lower()
     
     # Check for false positive patterns
-    for pattern in FALSE_POSITIVE_PATTERNS:
-        if re.search(pattern, text_lower, re.IGNORECASE):
-            # But if it also contains real AI terms, it's not a false positive
-            real_ai_terms = ['artificial intelligence', 'machine learning', 'ai system', 
-                           'ai technology', 'ai model', 'generative ai', 'ai regulation',
-                           'ai safety', 'ai ethics', 'chatgpt', 'large language model']
-            if any(term in text_lower for term in real_ai_terms):
-                return False
-            
-            # Check if context has standalone AI
-            collapsed = re.sub(r'\s+', '', context_text)
-            if not re.search(r'(?:^|[^a-zA-Z])AI(?:[^a-zA-Z]|$)', collapsed):
-                return True
+    if not patterns.false_positive.search(text_lower):
+        return False
+    
+    # But if it also contains real AI terms, it's not a false positive
+    if any(term in text_lower for term in matchers.REAL_AI_TERMS):
+        return False
     
-    return False
+    # Check if context has standalone AI
+    collapsed = patterns.whitespace.sub('', context_text)
+    return not patterns.standalone_ai.search(collapsed)
 
 
 def classify_sentiment(context_text: str, debate_title: str) -> tuple[str, float, str]:
@@ -82,17 +42,12 @@ def classify_sentiment(context_text: str, debate_title: str) -> tuple[str, float
     text_lower = (context_text + ' ' + debate_title).lower()
     
     # Check for real AI mentions first
-    is_real_ai = any(term in text_lower for term in [
-        'artificial intelligence', 'machine learning', 'ai system', 
-        'ai technology', 'ai model', 'generative ai', 'ai regulation',
-        'ai safety', 'ai ethics', 'chatgpt', 'large language model',
-        'ai act', 'ai governance', 'ai strategy', 'ai policy'
-    ])
+    is_real_ai = any(term in text_lower for term in matchers.CLASSIFY_AI_TERMS)
     
     # Count keyword matches
-    positive_count = sum(1 for kw in POSITIVE_KEYWORDS if kw in text_lower)
-    negative_count = sum(1 for kw in NEGATIVE_KEYWORDS if kw in text_lower)
-    neutral_count = sum(1 for kw in NEUTRAL_KEYWORDS if kw in text_lower)
+    positive_count = sum(1 for kw in matchers.POSITIVE if kw in text_lower)
+    negative_count = sum(1 for kw in matchers.NEGATIVE if kw in text_lower)
+    neutral_count = sum(1 for kw in matchers.NEUTRAL if kw in text_lower)
     
     # Weight based on context
     total = positive_count + negative_count + neutral_count
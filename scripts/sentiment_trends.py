@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Time-series sentiment trends for Parliament AI mentions.
+Keeps daily, weekly and monthly counts, sentiment ratios and exponentially
+weighted moving averages per house and per party in a persisted state file,
+so appending new mentions only touches the new records. Mentions already in
+the state are relabelled when a later results file changes their sentiment.
+
+Usage:
+    python scripts/sentiment_trends.py update sentiment_batches/batch_*.json \
+        --results sentiment_batches/sentiment_results.json
+    python scripts/sentiment_trends.py export --out sentiment_trends.json
+"""
+
+import argparse
+import json
+import sys
+from datetime import date
+from pathlib import Path
+from typing import Iterable, Optional
+
+# Make the shared sentiment_common package importable when run as a script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sentiment_common.files import atomic_open  # noqa: E402
+from sentiment_common.results import iter_result_records  # noqa: E402
+
+GRANULARITIES = ('daily', 'weekly', 'monthly')
+DIMENSIONS = ('all', 'house', 'party')
+SENTIMENTS = ('positive', 'neutral', 'negative', 'disregard', 'unclassified')
+
+# Smoothing factor per granularity: roughly a fortnight, two months and a
+# half-year of memory respectively
+DEFAULT_ALPHA = {'daily': 0.1, 'weekly': 0.25, 'monthly': 0.3}
+
+STATE_VERSION = 2
+
+
+def period_label(day: date, granularity: str) -> str:
+    if granularity == 'daily':
+        return day.isoformat()
+    if granularity == 'weekly':
+        year, week, _ = day.isocalendar()
+        return f'{year}-W{week:02d}'
+    return f'{day.year}-{day.month:02d}'
+
+
+def period_index(label: str, granularity: str) -> int:
+    """Map a period label onto consecutive integers so gaps can be measured."""
+    if granularity == 'daily':
+        return date.fromisoformat(label).toordinal()
+    if granularity == 'weekly':
+        year, week = label.split('-W')
+        return date.fromisocalendar(int(year), int(week), 1).toordinal() // 7
+    year, month = label.split('-')
+    return int(year) * 12 + int(month) - 1
+
+
+def ratios(counts: dict) -> Optional[tuple[float, float]]:
+    """Positive and negative share of classified (non-disregarded) mentions."""
+    classified = counts['positive'] + counts['neutral'] + counts['negative']
+    if not classified:
+        return None
+    return counts['positive'] / classified, counts['negative'] / classified
+
+
+def series_keys(mention: dict) -> list[tuple[str, str]]:
+    party = mention.get('party') or {}
+    return [
+        ('all', 'all'),
+        ('house', mention.get('house') or 'Unknown'),
+        ('party', party.get('abbreviation') or party.get('name') or 'Unknown'),
+    ]
+
+
+class TrendSeries:
+    """
+    Period counts for one (granularity, dimension, key) series.
+
+    Every period except the latest is closed and carries its EWMA snapshot.
+    The latest period stays open: its EWMA is derived on read from the
+    previous snapshot. Count changes are applied a batch at a time and the
+    snapshots are recomputed once, from the earliest period the batch touched.
+    """
+
+    def __init__(self, granularity: str, alpha: float, periods: dict = None):
+        self.granularity = granularity
+        self.alpha = alpha
+        self.periods = periods or {}
+        self._order = sorted(self.periods, key=self._index)
+
+    def _index(self, label: str) -> int:
+        return period_index(label, self.granularity)
+
+    def update(self, changes: Iterable[tuple[str, str, int]]):
+        """Apply (period label, sentiment, delta) count changes and refresh the snapshots once."""
+        touched = set()
+        for label, sentiment, delta in changes:
+            record = self.periods.get(label)
+            if record is None:
+                record = {'total': 0, **{s: 0 for s in SENTIMENTS}}
+                self.periods[label] = record
+            record['total'] += delta
+            record[sentiment] += delta
+            touched.add(label)
+        if not touched:
+            return
+
+        previous_last = len(self._order) - 1
+        if len(self.periods) != len(self._order):
+            self._order = sorted(self.periods, key=self._index)
+        start = next(i for i, label in enumerate(self._order) if label in touched)
+        # The former latest period is closed once a later one exists
+        if previous_last >= 0:
+            start = min(start, previous_last)
+        self._recompute_from(start)
+
+    def _snapshot_before(self, position: int) -> Optional[dict]:
+        return self.periods[self._order[position - 1]].get('ewma') if position > 0 else None
+
+    def _smoothed(self, position: int) -> dict:
+        """EWMA values at the period in position, given the snapshot before it."""
+        label = self._order[position]
+        counts = self.periods[label]
+        prior = self._snapshot_before(position)
+        current_ratios = ratios(counts)
+
+        if prior is None:
+            return {
+                'count': float(counts['total']),
+                'positiveRatio': current_ratios[0] if current_ratios else None,
+                'negativeRatio': current_ratios[1] if current_ratios else None,
+            }
+
+        # Empty periods between the two observations decay the count towards zero
+        gap = self._index(label) - self._index(self._order[position - 1]) - 1
+        decay = (1 - self.alpha) ** gap
+        smoothed = {'count': self.alpha * counts['total'] + (1 - self.alpha) * prior['count'] * decay}
+        for i, name in enumerate(('positiveRatio', 'negativeRatio')):
+            if current_ratios is None:
+                smoothed[name] = prior[name]
+            elif prior[name] is None:
+                smoothed[name] = current_ratios[i]
+            else:
+                smoothed[name] = self.alpha * current_ratios[i] + (1 - self.alpha) * prior[name]
+        return smoothed
+
+    def _close(self, position: int):
+        self.periods[self._order[position]]['ewma'] = self._smoothed(position)
+
+    def _recompute_from(self, position: int):
+        for i in range(position, len(self._order) - 1):
+            self._close(i)
+        self.periods[self._order[-1]].pop('ewma', None)
+
+    def points(self) -> list[dict]:
+        out = []
+        for position, label in enumerate(self._order):
+            counts = self.periods[label]
+            ewma = counts.get('ewma') or self._smoothed(position)
+            current_ratios = ratios(counts)
+            out.append({
+                'period': label,
+                **{k: counts[k] for k in ('total',) + SENTIMENTS},
+                'positiveRatio': round(current_ratios[0], 4) if current_ratios else None,
+                'negativeRatio': round(current_ratios[1], 4) if current_ratios else None,
+                'ewmaCount': round(ewma['count'], 4),
+                'ewmaPositiveRatio': round(ewma['positiveRatio'], 4) if ewma['positiveRatio'] is not None else None,
+                'ewmaNegativeRatio': round(ewma['negativeRatio'], 4) if ewma['negativeRatio'] is not None else None,
+            })
+        return out
+
+
+class TrendEngine:
+    def __init__(self, alpha: dict = None):
+        self.alpha = dict(DEFAULT_ALPHA, **(alpha or {}))
+        # Contribution ID -> {'periods', 'keys', 'sentiment'}, enough to move
+        # a mention's counts without the batch file it came from
+        self.seen = {}
+        self.series = {}
+
+    def _series(self, granularity: str, dimension: str, key: str) -> TrendSeries:
+        series_id = (granularity, dimension, key)
+        series = self.series.get(series_id)
+        if series is None:
+            series = TrendSeries(granularity, self.alpha[granularity])
+            self.series[series_id] = series
+        return series
+
+    def _queue(self, changes: dict, entry: dict, sentiment: str, delta: int):
+        for granularity, label in zip(GRANULARITIES, entry['periods']):
+            for dimension, key in entry['keys']:
+                changes.setdefault((granularity, dimension, key), []).append((label, sentiment, delta))
+
+    def add_mentions(self, mentions: Iterable[dict], sentiments: dict) -> tuple[int, int]:
+        """
+        Fold new mentions into every series and apply changed sentiments.
+
+        Already-seen IDs are not counted again, but a label in sentiments that
+        differs from the stored one moves the mention's counts to the new
+        sentiment. Returns (mentions added, mentions relabelled).
+        """
+        changes = {}
+        added = relabelled = 0
+        for mention in mentions:
+            ext_id = mention['contributionExtId']
+            if ext_id in self.seen or not mention.get('date'):
+                continue
+            day = date.fromisoformat(mention['date'][:10])
+            entry = {
+                'periods': [period_label(day, g) for g in GRANULARITIES],
+                'keys': series_keys(mention),
+                'sentiment': sentiments.get(ext_id, 'unclassified'),
+            }
+            self.seen[ext_id] = entry
+            self._queue(changes, entry, entry['sentiment'], 1)
+            added += 1
+
+        for ext_id, sentiment in sentiments.items():
+            entry = self.seen.get(ext_id)
+            if entry is None or entry['sentiment'] == sentiment:
+                continue
+            self._queue(changes, entry, entry['sentiment'], -1)
+            self._queue(changes, entry, sentiment, 1)
+            entry['sentiment'] = sentiment
+            relabelled += 1
+
+        for series_id, series_changes in changes.items():
+            self._series(*series_id).update(series_changes)
+        return added, relabelled
+
+    def export(self) -> dict:
+        out = {g: {d: {} for d in DIMENSIONS} for g in GRANULARITIES}
+        for (granularity, dimension, key), series in sorted(self.series.items()):
+            out[granularity][dimension][key] = series.points()
+        return out
+
+    def save(self, path: Path):
+        state = {
+            'version': STATE_VERSION,
+            'alpha': self.alpha,
+            'seen': self.seen,
+            'series': [
+                {'granularity': g, 'dimension': d, 'key': k, 'periods': s.periods}
+                for (g, d, k), s in self.series.items()
+            ],
+        }
+        with atomic_open(path) as f:
+            json.dump(state, f, separators=(',', ':'))
+
+    @classmethod
+    def load(cls, path: Path) -> 'TrendEngine':
+        with open(path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        if state.get('version') != STATE_VERSION:
+            raise ValueError(f'Unsupported trend state version: {state.get("version")}; run update --rebuild')
+        engine = cls(state['alpha'])
+        engine.seen = state['seen']
+        for entry in state['series']:
+            g = entry['granularity']
+            engine.series[(g, entry['dimension'], entry['key'])] = TrendSeries(g, engine.alpha[g], entry['periods'])
+        return engine
+
+
+def load_sentiments(paths: list[Path]) -> dict:
+    sentiments = {}
+    for path in paths:
+        for record in iter_result_records(path):
+            sentiments[record['id']] = record['sentiment']
+    return sentiments
+
+
+def iter_mentions(paths: list[Path]) -> Iterable[dict]:
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            yield from json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Maintain precomputed sentiment trend series')
+    parser.add_argument('--state', type=Path, default=Path('sentiment_batches/trend_state.json'))
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    update = sub.add_parser('update', help='Append mention batch files to the trend state')
+    update.add_argument('batches', nargs='*', type=Path)
+    update.add_argument('--results', nargs='*', type=Path, default=[],
+                        help='Results files mapping contribution IDs to sentiments')
+    update.add_argument('--rebuild', action='store_true', help='Discard existing state first')
+
+    export = sub.add_parser('export', help='Write chart-ready series')
+    export.add_argument('--out', type=Path, default=Path('sentiment_trends.json'))
+
+    args = parser.parse_args()
+
+    if args.command == 'update':
+        engine = TrendEngine() if args.rebuild or not args.state.exists() else TrendEngine.load(args.state)
+        added, relabelled = engine.add_mentions(iter_mentions(args.batches), load_sentiments(args.results))
+        engine.save(args.state)
+        print(f'Added {added} new mentions and relabelled {relabelled} ({len(engine.seen)} total) in {args.state}')
+    else:
+        engine = TrendEngine.load(args.state)
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(engine.export(), f, indent=2)
+        print(f'Trend series saved to: {args.out}')
+
+
+if __name__ == '__main__':
+    main()
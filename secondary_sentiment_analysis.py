@@ -5,7 +5,6 @@ This script performs an independent analysis of all 84 contributions to verify t
 """
 
 import json
-import requests
 import re
 from datetime import datetime
 from typing import Dict, Optional, Tuple
@@ -138,13 +137,8 @@ def analyze_context_sentiment(context: str, speaker: str, sentence: str) -> Tupl
         else:
             return "neutral", 0.5, "Insufficient sentiment indicators"
 
-def main():
-    """Main analysis function"""
-    # Load existing sentiment data
-    with open('sentimentData.ts', 'r') as f:
-        content = f.read()
-    
-    # Extract existing sentiment mappings using regex
+def parse_existing_sentiments(content: str) -> Dict[str, str]:
+    """Extract existing sentiment mappings from sentimentData.ts using regex"""
     sentiment_pattern = r'"([A-F0-9-]+)":\s*"(positive|neutral|negative)"'
     existing_sentiments = {}
     
@@ -152,16 +146,18 @@ def main():
         ext_id, sentiment = match.groups()
         existing_sentiments[ext_id] = sentiment
     
-    print(f"Found {len(existing_sentiments)} existing sentiment classifications")
+    return existing_sentiments
+
+def main():
+    """Main analysis function"""
+    # Load existing sentiment mappings
+    with open('sentimentData.ts', 'r') as f:
+        existing_sentiments = parse_existing_sentiments(f.read())
     
-    # Extract speaker information from comments
-    speaker_pattern = r'// (.+?) - \d{4}-\d{2}-\d{2} - (.+)'
-    speaker_info = {}
+    print(f"Found {len(existing_sentiments)} existing sentiment classifications")
     
-    for match in re.finditer(speaker_pattern, content):
-        speaker, reason = match.groups()
-        # We'd need to map this to the ext_id, but the current structure doesn't make this trivial
-        # For now, we'll note this limitation
+    # Speaker comments in sentimentData.ts are not keyed by ext_id, so they
+    # cannot be mapped onto the classifications yet
     
     # Perform independent analysis
     analysis_results = []
@@ -0,0 +1,17 @@
+"""
+Shared helpers for the sentiment analysis CLIs.
+
+Kept deliberately light: submodules are imported by the scripts that need
+them, and heavy third-party dependencies go through lazy_import.
+"""
+
+__all__ = ['lazy_import']
+
+
+def __getattr__(name: str):
+    # Resolved on first access so scripts that only use a submodule, like the
+    # classifier, do not load importlib machinery at start-up
+    if name == 'lazy_import':
+        from sentiment_common.lazy import lazy_import
+        return lazy_import
+    raise AttributeError(f"module 'sentiment_common' has no attribute {name!r}")
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for the sentiment analysis CLIs.
+Times loading each script's module top level in a fresh interpreter, net of
+bare interpreter start-up, and optionally lists its slowest imports or
+compares against the same scripts at another git revision.
+
+Usage:
+    python -m sentiment_common.bench_startup
+    python -m sentiment_common.bench_startup --runs 20 --detail
+    python -m sentiment_common.bench_startup --compare 0675c88
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+SCRIPTS = [
+    'scripts/sentiment_analysis.py',
+    'sentiment_verification.py',
+    'enhanced_sentiment_analysis.py',
+    'secondary_sentiment_analysis.py',
+    'corpus_store.py',
+    'scripts/convex_export.py',
+    'scripts/sentiment_trends.py',
+]
+
+# Executes the module body (imports, constants, and a first classifier call
+# where one exists) without running main()
+LOADER = (
+    "import runpy, sys; sys.path[:0] = [{root!r}, {script_dir!r}]; "
+    "ns = runpy.run_path({path!r}); "
+    "ns.get('classify_sentiment', lambda *a: None)('', '')"
+)
+
+
+def run_once(args: list, root: Path = REPO_ROOT) -> float:
+    start = time.perf_counter()
+    subprocess.run(args, cwd=root, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return (time.perf_counter() - start) * 1000
+
+
+def time_command(args: list, runs: int) -> list:
+    return [run_once(args) for _ in range(runs)]
+
+
+def loader_args(script: str, extra: list = None, root: Path = REPO_ROOT) -> list:
+    path = root / script
+    code = LOADER.format(root=str(root), script_dir=str(path.parent), path=str(path))
+    return [sys.executable, *(extra or []), '-c', code]
+
+
+def checkout_revision(rev: str, dest: Path) -> Path:
+    """Extract the tree at rev into dest, data files included, for a side-by-side run."""
+    archive = subprocess.run(['git', 'archive', rev], cwd=REPO_ROOT, check=True, capture_output=True).stdout
+    subprocess.run(['tar', '-x', '-C', str(dest)], input=archive, check=True)
+    return dest
+
+
+def slowest_imports(script: str, top: int) -> list:
+    """Parse -X importtime output into the top cumulative import times (ms)."""
+    result = subprocess.run(loader_args(script, ['-X', 'importtime']), cwd=REPO_ROOT,
+                            check=True, capture_output=True, text=True)
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        rows.append((int(cumulative_us) / 1000, name.strip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def compare(scripts: list, runs: int, rev: str, other_root: Path):
+    """Print median load times at rev and in the working tree, side by side."""
+    print(f"{'Script':<40} {rev:>10} {'current':>10} {'change':>9}")
+    for script in scripts:
+        if not (other_root / script).exists():
+            print(f"{script:<40} {'-':>10}")
+            continue
+        before, after = [], []
+        try:
+            # Interleaved so drift in machine load affects both trees alike
+            for _ in range(runs):
+                before.append(run_once(loader_args(script, root=other_root), other_root))
+                after.append(run_once(loader_args(script)))
+        except subprocess.CalledProcessError:
+            print(f"{script:<40} {'fails':>10}  (not loadable in one of the trees here)")
+            continue
+        old, new = statistics.median(before), statistics.median(after)
+        print(f"{script:<40} {old:>8.1f}ms {new:>8.1f}ms {(new - old) / old * 100:>+8.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark CLI start-up time')
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--detail', action='store_true', help='Show the slowest imports per script')
+    parser.add_argument('--compare', metavar='REV', help='Also time the scripts as they were at this git revision')
+    parser.add_argument('scripts', nargs='*', default=SCRIPTS)
+    args = parser.parse_args()
+
+    if args.compare:
+        with tempfile.TemporaryDirectory() as tmp:
+            compare(args.scripts, args.runs, args.compare, checkout_revision(args.compare, Path(tmp)))
+        return
+
+    baseline = statistics.median(time_command([sys.executable, '-c', 'pass'], args.runs))
+    print(f"Interpreter baseline: {baseline:.1f} ms (median of {args.runs})")
+    print(f"{'Script':<40} {'median':>9} {'min':>9} {'net':>9}")
+
+    for script in args.scripts:
+        samples = time_command(loader_args(script), args.runs)
+        median = statistics.median(samples)
+        print(f"{script:<40} {median:>7.1f}ms {min(samples):>7.1f}ms {median - baseline:>7.1f}ms")
+        if args.detail:
+            for cumulative_ms, name in slowest_imports(script, 5):
+                print(f"    {cumulative_ms:>7.1f}ms  {name}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,31 @@
+"""
+Atomic file writes.
+
+Output goes to a sibling .tmp file that replaces the target only once it is
+complete, so readers and interrupted runs never see a partially written file.
+"""
+
+import os
+from contextlib import contextmanager
+from pathlib import Path
+
+
+@contextmanager
+def atomic_open(path, mode: str = 'w', encoding: str = 'utf-8'):
+    """Open a temporary file for writing that replaces path when the block exits cleanly."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + '.tmp')
+    try:
+        with open(tmp, mode, encoding=None if 'b' in mode else encoding) as f:
+            yield f
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    os.replace(tmp, path)
+
+
+def write_atomic(path, data):
+    """Write str or bytes data to path atomically."""
+    with atomic_open(path, 'w' if isinstance(data, str) else 'wb') as f:
+        f.write(data)
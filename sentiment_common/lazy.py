@@ -0,0 +1,34 @@
+"""
+Deferred module imports.
+
+Scripts that only touch an optional or heavy dependency on some code paths
+bind it with lazy_import at module level; the real import happens on first
+attribute access, so invocations that never use it do not pay for it.
+"""
+
+import importlib
+import types
+
+
+class _LazyModule(types.ModuleType):
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__['_lazy_target'] = None
+
+    def _load(self):
+        module = self.__dict__['_lazy_target']
+        if module is None:
+            module = importlib.import_module(self.__name__)
+            self.__dict__['_lazy_target'] = module
+        return module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """Return a proxy for module name that imports it on first use."""
+    return _LazyModule(name)
@@ -0,0 +1,60 @@
+"""
+Keyword lexicons and false-positive patterns for the keyword sentiment classifier.
+"""
+
+# False positive patterns (Hansard API highlighting artifacts)
+FALSE_POSITIVE_PATTERNS = [
+    r'\b(pr|f|m|aw|ch|s|tr|pl|r|cl|str|br|afr|obt|st|dr|gr|upl|sl|p|w|restr|ent|ret|sust|rem|det|expl|att|cert|m)[\s]?ai[\s]?(se|n|m|d|t|r|l|ned|nt|ns|ning|ned|der|rman|rmanship|nst|led|ling|ls)\b',
+    r'\bai[\s]?m\b',  # aim
+    r'\bs[\s]?ai[\s]?d\b',  # said
+    r'\bch[\s]?ai[\s]?r\b',  # chair
+    r'\bpr[\s]?ai[\s]?se\b',  # praise
+    r'\bm[\s]?ai[\s]?den\b',  # maiden
+    r'\bAff[\s]?ai[\s]?rs\b',  # Affairs
+    r'\brem[\s]?ai[\s]?n\b',  # remain
+    r'\bobt[\s]?ai[\s]?n\b',  # obtain
+    r'\bcont[\s]?ai[\s]?n\b',  # contain
+    r'\bsust[\s]?ai[\s]?n\b',  # sustain
+    r'\bdet[\s]?ai[\s]?l\b',  # detail
+]
+
+# Keywords for sentiment classification
+POSITIVE_KEYWORDS = [
+    'opportunity', 'opportunities', 'benefit', 'benefits', 'potential',
+    'innovation', 'innovative', 'progress', 'advancement', 'growth',
+    'support', 'supporting', 'welcome', 'welcomed', 'exciting',
+    'transform', 'transformative', 'improve', 'improvement', 'enhance',
+    'enable', 'enabling', 'empower', 'productivity', 'efficiency',
+    'breakthrough', 'promising', 'optimistic', 'lead', 'leadership',
+    'invest', 'investment', 'boost', 'advantage', 'advantageous'
+]
+
+NEGATIVE_KEYWORDS = [
+    'risk', 'risks', 'danger', 'dangerous', 'threat', 'concern', 'concerned',
+    'worry', 'worried', 'fear', 'fears', 'problem', 'problems', 'challenge',
+    'harmful', 'harm', 'damage', 'unsafe', 'unsafe', 'regulate', 'regulation',
+    'bias', 'biased', 'discrimination', 'discriminatory', 'unemployment',
+    'job loss', 'job losses', 'replace', 'replacement', 'displace',
+    'misinformation', 'disinformation', 'deepfake', 'deepfakes',
+    'surveillance', 'privacy', 'unethical', 'ethical concerns',
+    'safeguard', 'safeguards', 'protect', 'protection', 'caution', 'cautious'
+]
+
+NEUTRAL_KEYWORDS = [
+    'question', 'questions', 'ask', 'asking', 'inquiry', 'review',
+    'committee', 'report', 'statement', 'update', 'minister', 'secretary',
+    'policy', 'legislation', 'bill', 'amendment', 'debate', 'discussion',
+    'consider', 'considering', 'examine', 'examining', 'assess', 'assessment'
+]
+
+# Terms that show a mention really is about AI, even when a split-word artefact is present
+REAL_AI_TERMS = [
+    'artificial intelligence', 'machine learning', 'ai system',
+    'ai technology', 'ai model', 'generative ai', 'ai regulation',
+    'ai safety', 'ai ethics', 'chatgpt', 'large language model'
+]
+
+# Wider set used by classify_sentiment, which also sees the debate title
+CLASSIFY_AI_TERMS = REAL_AI_TERMS + [
+    'ai act', 'ai governance', 'ai strategy', 'ai policy'
+]
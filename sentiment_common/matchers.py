@@ -0,0 +1,33 @@
+"""
+Keyword tables and compiled patterns for the keyword sentiment classifier.
+
+The keyword tables are plain tuples built at import. The patterns are only
+needed by is_false_positive, so they are compiled once per process on first
+use; the false-positive patterns are joined into a single alternation so one
+search replaces a search per pattern.
+"""
+
+import functools
+import re
+from collections import namedtuple
+
+from sentiment_common import lexicons
+
+REAL_AI_TERMS = tuple(lexicons.REAL_AI_TERMS)
+CLASSIFY_AI_TERMS = tuple(lexicons.CLASSIFY_AI_TERMS)
+POSITIVE = tuple(lexicons.POSITIVE_KEYWORDS)
+NEGATIVE = tuple(lexicons.NEGATIVE_KEYWORDS)
+NEUTRAL = tuple(lexicons.NEUTRAL_KEYWORDS)
+
+# collections.namedtuple rather than typing.NamedTuple: typing alone costs
+# more start-up time than the rest of the classifier's imports
+Patterns = namedtuple('Patterns', ['false_positive', 'whitespace', 'standalone_ai'])
+
+
+@functools.lru_cache(maxsize=None)
+def get_patterns() -> Patterns:
+    return Patterns(
+        false_positive=re.compile('|'.join(f'(?:{p})' for p in lexicons.FALSE_POSITIVE_PATTERNS), re.IGNORECASE),
+        whitespace=re.compile(r'\s+'),
+        standalone_ai=re.compile(r'(?:^|[^a-zA-Z])AI(?:[^a-zA-Z]|$)'),
+    )
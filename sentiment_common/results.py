@@ -0,0 +1,27 @@
+"""
+Readers for sentiment results files (lists of {id, sentiment, confidence, reasoning}).
+"""
+
+import json
+from pathlib import Path
+from typing import Iterator
+
+
+def iter_result_records(path: Path) -> Iterator[dict]:
+    """Yield result records from a results file.
+
+    Some agent-written results files contain several JSON arrays back to back,
+    so the file is decoded as a sequence of JSON values.
+    """
+    decoder = json.JSONDecoder()
+    text = Path(path).read_text(encoding='utf-8')
+    pos = 0
+    while True:
+        while pos < len(text) and text[pos].isspace():
+            pos += 1
+        if pos >= len(text):
+            break
+        value, pos = decoder.raw_decode(text, pos)
+        if isinstance(value, dict):
+            value = [value]
+        yield from value
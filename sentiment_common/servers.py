@@ -0,0 +1,10 @@
+"""
+Local stand-in HTTP servers for exercising the upload and lookup clients.
+"""
+
+from http.server import ThreadingHTTPServer
+
+
+class StandInServer(ThreadingHTTPServer):
+    # The default backlog of 5 drops connections from concurrent clients
+    request_queue_size = 128
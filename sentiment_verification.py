@@ -4,14 +4,29 @@ Secondary Sentiment Analysis Verification
 Performs independent analysis based on existing sentiment data patterns and metadata
 """
 
+import io
 import json
 import re
-from datetime import datetime
-from typing import Dict, List, Tuple
+import time
+from typing import TYPE_CHECKING, Dict, List, Tuple
 from collections import defaultdict, Counter
 
+# The corpus store, report renderer and argparse are imported where they are
+# used, so importing the analyzer stays as cheap as it was before reports
+if TYPE_CHECKING:
+    from corpus_store import CorpusStore
+    from report_renderer import ReportRenderer
+
+def parse_sentiment_entries(content: str) -> List[Tuple[str, str, str, str]]:
+    """Extract sentiment mappings with metadata from sentimentData.ts"""
+    entry_pattern = r'// (.+?) - \d{4}-\d{2}-\d{2} - (.+?)\n\s*"([A-F0-9-]+)":\s*"(positive|neutral|negative)"'
+    return re.findall(entry_pattern, content)
+
 class SentimentAnalyzer:
-    def __init__(self):
+    def __init__(self, corpus: 'CorpusStore' = None):
+        # Optional corpus store used to join contribution text into reports
+        self.corpus = corpus
+        
         self.positive_indicators = [
             'welcome', 'support', 'excellent', 'opportunity', 'progress', 'please', 'thank', 
             'congratulations', 'great', 'fantastic', 'important', 'valuable', 'committed',
@@ -79,11 +94,7 @@ class SentimentAnalyzer:
         """
         # Parse existing sentiment data
         with open('sentimentData.ts', 'r') as f:
-            content = f.read()
-        
-        # Extract sentiment mappings with metadata
-        entry_pattern = r'// (.+?) - \d{4}-\d{2}-\d{2} - (.+?)\n\s*"([A-F0-9-]+)":\s*"(positive|neutral|negative)"'
-        matches = re.findall(entry_pattern, content)
+            matches = parse_sentiment_entries(f.read())
         
         print(f"Found {len(matches)} sentiment entries for analysis")
         
@@ -155,96 +166,116 @@ class SentimentAnalyzer:
         return results
     
     def generate_report(self, results: Dict) -> str:
-        """Generate comprehensive verification report"""
-        report = []
-        report.append("# Secondary Sentiment Analysis Verification Report")
-        report.append("=" * 60)
-        report.append(f"Analysis Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report.append(f"Total Contributions Analyzed: {results['summary']['total_analyses']}")
-        report.append("")
+        """Generate comprehensive verification report as a single string"""
+        from report_renderer import ReportRenderer
+
+        buffer = io.StringIO()
+        self.write_report(results, ReportRenderer(buffer))
+        return buffer.getvalue()
+    
+    def write_report(self, results: Dict, renderer: 'ReportRenderer'):
+        """Stream the verification report section by section through renderer"""
+        renderer.title("Secondary Sentiment Analysis Verification Report", rule_width=60)
+        renderer.text(f"Analysis Date: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+        renderer.text(f"Total Contributions Analyzed: {results['summary']['total_analyses']}")
+        renderer.blank()
         
         # Executive Summary
-        report.append("## Executive Summary")
-        report.append(f"- **Agreement Rate**: {results['summary']['agreement_rate']:.1f}%")
-        report.append(f"- **Agreements**: {results['summary']['agreements']}")
-        report.append(f"- **Disagreements**: {results['summary']['disagreements']}")
-        report.append("")
+        renderer.heading("Executive Summary")
+        renderer.bullet(f"**Agreement Rate**: {results['summary']['agreement_rate']:.1f}%")
+        renderer.bullet(f"**Agreements**: {results['summary']['agreements']}")
+        renderer.bullet(f"**Disagreements**: {results['summary']['disagreements']}")
+        renderer.blank()
         
         # Confidence Analysis
-        report.append("## Confidence Analysis")
-        report.append(f"- **High Confidence (≥80%)**: {results['summary']['high_confidence']} analyses")
-        report.append(f"- **Medium Confidence (60-79%)**: {results['summary']['medium_confidence']} analyses")
-        report.append(f"- **Low Confidence (<60%)**: {results['summary']['low_confidence']} analyses")
-        report.append("")
+        renderer.heading("Confidence Analysis")
+        renderer.bullet(f"**High Confidence (≥80%)**: {results['summary']['high_confidence']} analyses")
+        renderer.bullet(f"**Medium Confidence (60-79%)**: {results['summary']['medium_confidence']} analyses")
+        renderer.bullet(f"**Low Confidence (<60%)**: {results['summary']['low_confidence']} analyses")
+        renderer.blank()
         
         # Sentiment Distribution
-        report.append("## Sentiment Distribution Comparison")
-        report.append("| Sentiment | Existing Count | Independent Count | Difference |")
-        report.append("|-----------|----------------|-------------------|------------|")
+        renderer.heading("Sentiment Distribution Comparison")
         
-        all_sentiments = set(results['sentiment_distribution']['existing'].keys()) | set(results['sentiment_distribution']['independent'].keys())
-        for sentiment in sorted(all_sentiments):
-            existing = results['sentiment_distribution']['existing'].get(sentiment, 0)
-            independent = results['sentiment_distribution']['independent'].get(sentiment, 0)
-            diff = independent - existing
-            report.append(f"| {sentiment} | {existing} | {independent} | {diff:+d} |")
-        report.append("")
+        existing_dist = results['sentiment_distribution']['existing']
+        independent_dist = results['sentiment_distribution']['independent']
+        all_sentiments = set(existing_dist.keys()) | set(independent_dist.keys())
+        rows = (
+            [sentiment, existing_dist.get(sentiment, 0), independent_dist.get(sentiment, 0),
+             f"{independent_dist.get(sentiment, 0) - existing_dist.get(sentiment, 0):+d}"]
+            for sentiment in sorted(all_sentiments)
+        )
+        renderer.table(["Sentiment", "Existing Count", "Independent Count", "Difference"], rows)
+        renderer.blank()
         
         # Discrepancies
-        if results['discrepancies']:
-            report.append("## Discrepancy Analysis")
-            report.append(f"Found {len(results['discrepancies'])} cases where independent analysis differs from original classification:")
-            report.append("")
-            
-            for i, disc in enumerate(results['discrepancies'][:10], 1):  # Show first 10
-                report.append(f"### {i}. {disc['speaker']} ({disc['date']})")
-                report.append(f"- **ID**: {disc['ext_id']}")
-                report.append(f"- **Original**: {disc['existing_sentiment']}")
-                report.append(f"- **Independent**: {disc['independent_sentiment']}")
-                report.append(f"- **Reasoning**: {disc['existing_reasoning']}")
-                report.append(f"- **Confidence**: {disc['confidence']:.2f}")
-                report.append("")
+        renderer.heading("Discrepancy Analysis")
+        if results['summary']['disagreements']:
+            renderer.text(f"Found {results['summary']['disagreements']} cases where independent analysis differs from original classification:")
+            renderer.blank()
+            renderer.items("Discrepancy Analysis", iter(results['discrepancies']), self._render_discrepancy)
+            renderer.blank()
         else:
-            report.append("## Discrepancy Analysis")
-            report.append("✅ **No discrepancies found** - Independent analysis agrees with all original classifications!")
-            report.append("")
+            renderer.text("✅ **No discrepancies found** - Independent analysis agrees with all original classifications!")
+            renderer.blank()
         
         # Methodology Notes
-        report.append("## Methodology Notes")
-        report.append("- Analysis based on sentiment indicators in reasoning metadata")
-        report.append("- Speaker role considered (minister vs opposition vs crossbench)")
-        report.append("- Confidence scores reflect strength of sentiment indicators")
-        report.append("- This verification validates the robustness of the original analysis")
-        report.append("")
+        renderer.heading("Methodology Notes")
+        renderer.bullet("Analysis based on sentiment indicators in reasoning metadata")
+        renderer.bullet("Speaker role considered (minister vs opposition vs crossbench)")
+        renderer.bullet("Confidence scores reflect strength of sentiment indicators")
+        renderer.bullet("This verification validates the robustness of the original analysis")
+        renderer.blank()
         
         # Recommendation
+        renderer.heading("Recommendation")
         if results['summary']['agreement_rate'] >= 90:
-            report.append("## Recommendation")
-            report.append("✅ **Original sentiment analysis is HIGHLY RELIABLE**")
-            report.append("The high agreement rate confirms the methodology and classifications are robust.")
+            renderer.text("✅ **Original sentiment analysis is HIGHLY RELIABLE**")
+            renderer.text("The high agreement rate confirms the methodology and classifications are robust.")
         elif results['summary']['agreement_rate'] >= 75:
-            report.append("## Recommendation") 
-            report.append("✅ **Original sentiment analysis is RELIABLE**")
-            report.append("Good agreement rate with minor discrepancies that may warrant review.")
+            renderer.text("✅ **Original sentiment analysis is RELIABLE**")
+            renderer.text("Good agreement rate with minor discrepancies that may warrant review.")
         else:
-            report.append("## Recommendation")
-            report.append("⚠️ **CONSIDER REVIEWING** discrepancies")
-            report.append("Lower agreement rate suggests some classifications may benefit from re-evaluation.")
-        
-        return "\n".join(report)
+            renderer.text("⚠️ **CONSIDER REVIEWING** discrepancies")
+            renderer.text("Lower agreement rate suggests some classifications may benefit from re-evaluation.")
+    
+    def _render_discrepancy(self, renderer: 'ReportRenderer', index: int, disc: Dict):
+        renderer.heading(f"{index}. {disc['speaker']} ({disc['date']})", level=3)
+        renderer.bullet(f"**ID**: {disc['ext_id']}")
+        renderer.bullet(f"**Original**: {disc['existing_sentiment']}")
+        renderer.bullet(f"**Independent**: {disc['independent_sentiment']}")
+        renderer.bullet(f"**Reasoning**: {disc['existing_reasoning']}")
+        renderer.bullet(f"**Confidence**: {disc['confidence']:.2f}")
+        mention = self.corpus.get(disc['ext_id']) if self.corpus else None
+        if mention:
+            renderer.bullet(f"**Debate**: {mention.get('debateTitle', '')} ({mention.get('date', '')})")
+            renderer.bullet(f"**Context**: {mention.get('contextText', '')}")
+        renderer.blank()
 
 def main():
     """Main execution function"""
-    analyzer = SentimentAnalyzer()
+    import argparse
+
+    from corpus_store import DEFAULT_CORPUS_DIR, CorpusStore
+    from report_renderer import open_report
+
+    parser = argparse.ArgumentParser(description="Verify existing sentiment classifications")
+    parser.add_argument('--report', default='secondary_sentiment_report.md',
+                        help="Report path; a .html suffix renders HTML")
+    parser.add_argument('--page-size', type=int, default=None,
+                        help="Split discrepancies into per-section files of this many entries")
+    parser.add_argument('--corpus', default=DEFAULT_CORPUS_DIR,
+                        help="Corpus store built by corpus_store.py, used to add contribution text")
+    args = parser.parse_args()
+    
+    analyzer = SentimentAnalyzer(CorpusStore.open_if_exists(args.corpus))
     
     print("Performing secondary sentiment analysis...")
     results = analyzer.verify_sentiment_classifications()
     
-    # Generate and save report
-    report = analyzer.generate_report(results)
-    
-    with open('secondary_sentiment_report.md', 'w') as f:
-        f.write(report)
+    # Stream report to disk
+    with open_report(args.report, page_size=args.page_size) as renderer:
+        analyzer.write_report(results, renderer)
     
     # Save detailed results
     with open('secondary_sentiment_results.json', 'w') as f:
@@ -253,7 +284,7 @@ def main():
     print(f"\nVerification complete!")
     print(f"Agreement rate: {results['summary']['agreement_rate']:.1f}%")
     print(f"Discrepancies: {results['summary']['disagreements']}")
-    print(f"Report saved to: secondary_sentiment_report.md")
+    print(f"Report saved to: {args.report}")
     print(f"Detailed results saved to: secondary_sentiment_results.json")
 
 if __name__ == "__main__":
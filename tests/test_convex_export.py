@@ -0,0 +1,64 @@
+import json
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+import convex_export  # noqa: E402
+from convex_export import MAX_CONVEX_ARRAY_LENGTH, MutationError, encode_chunk, post_chunk  # noqa: E402
+
+
+@pytest.fixture
+def stand_in(tmp_path):
+    def start(fail_rate=0.0):
+        server = convex_export.make_stand_in_server(0, tmp_path / 'received.jsonl', fail_rate)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f'http://127.0.0.1:{server.server_address[1]}'
+
+    servers = []
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def update(ext_id):
+    return {'contributionExtId': ext_id, 'sentiment': 'neutral', 'sentimentConfidence': 0.5, 'sentimentReasoning': ''}
+
+
+def test_client_error_reports_message_and_is_not_retryable(stand_in):
+    url = stand_in()
+    data = encode_chunk([update(str(i)) for i in range(MAX_CONVEX_ARRAY_LENGTH + 1)])
+    with pytest.raises(MutationError, match='HTTP 400: Array too long') as raised:
+        post_chunk(url, data)
+    assert not raised.value.retryable
+
+
+def test_server_error_reports_message_and_is_retryable(stand_in):
+    url = stand_in(fail_rate=1.0)
+    with pytest.raises(MutationError, match='HTTP 500: Injected failure') as raised:
+        post_chunk(url, encode_chunk([update('1')]))
+    assert raised.value.retryable
+
+
+@pytest.mark.parametrize('retryable, calls', [(False, 1), (True, 3)])
+def test_upload_retries_only_retryable_errors(tmp_path, monkeypatch, retryable, calls):
+    results = tmp_path / 'results.json'
+    results.write_text(json.dumps([{'id': '1', 'sentiment': 'neutral', 'confidence': 0.5}]), encoding='utf-8')
+    convex_export.build_export([results], tmp_path / 'export')
+
+    attempts = []
+
+    def failing_post(*args):
+        attempts.append(args)
+        raise MutationError('rejected', retryable=retryable)
+
+    monkeypatch.setattr(convex_export, 'post_chunk', failing_post)
+    monkeypatch.setattr(convex_export.time, 'sleep', lambda delay: None)
+    stats = convex_export.upload_export(tmp_path / 'export', 'http://unused', retries=2)
+    assert len(attempts) == calls
+    assert stats['failed'] == 1
@@ -0,0 +1,25 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from extract_pdf_pages import normalise_text  # noqa: E402
+
+
+def test_line_break_hyphen_is_kept_in_compounds():
+    assert normalise_text('a well-\nestablished sector') == 'a well-established sector'
+    assert normalise_text('face-to-\nface support') == 'face-to-face support'
+
+
+def test_soft_hyphen_break_is_dropped():
+    assert normalise_text('infra­\nstructure') == 'infrastructure'
+    assert normalise_text('infra­structure') == 'infrastructure'
+
+
+def test_list_items_and_capitalised_lines_are_not_joined():
+    assert normalise_text('AI-\nRelevant') == 'AI-\nRelevant'
+    assert normalise_text('-\nThe plan') == '-\nThe plan'
+
+
+def test_whitespace_is_collapsed():
+    assert normalise_text('  one \t two \r\n\n\n\nthree  ') == 'one two\n\nthree'
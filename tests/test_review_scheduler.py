@@ -0,0 +1,49 @@
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from review_scheduler import merge_results  # noqa: E402
+
+
+def write_results(path, labels):
+    path.write_text(json.dumps([
+        {'id': ext_id, 'sentiment': sentiment, 'confidence': 0.8, 'reasoning': ''}
+        for ext_id, sentiment in labels.items()
+    ]), encoding='utf-8')
+
+
+def merged_labels(path):
+    return {r['id']: r['sentiment'] for r in json.loads(path.read_text(encoding='utf-8'))}
+
+
+def fresh_merge(tmp_path, paths):
+    merged_path = tmp_path / 'fresh' / 'merged.json'
+    merge_results(paths, merged_path)
+    return merged_labels(merged_path)
+
+
+def test_changed_earlier_file_does_not_override_later_one(tmp_path):
+    a, b = tmp_path / 'a.json', tmp_path / 'b.json'
+    write_results(a, {'X': 'positive', 'Y': 'neutral'})
+    write_results(b, {'X': 'negative'})
+    merged_path = tmp_path / 'merged.json'
+    merge_results([a, b], merged_path)
+
+    write_results(a, {'X': 'positive', 'Y': 'negative'})
+    merge_results([a, b], merged_path)
+
+    assert merged_labels(merged_path) == fresh_merge(tmp_path, [a, b]) == {'X': 'negative', 'Y': 'negative'}
+
+
+def test_new_and_unchanged_files_match_fresh_merge(tmp_path):
+    a, b = tmp_path / 'a.json', tmp_path / 'b.json'
+    write_results(a, {'X': 'positive'})
+    write_results(b, {'X': 'neutral', 'Z': 'negative'})
+    merged_path = tmp_path / 'merged.json'
+    merge_results([a], merged_path)
+
+    assert merge_results([a, b], merged_path) == (1, 2)
+    assert merge_results([a, b], merged_path) == (0, 0)
+    assert merged_labels(merged_path) == fresh_merge(tmp_path, [a, b])
@@ -0,0 +1,57 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'scripts'))
+
+from sentiment_trends import TrendEngine, iter_mentions, load_sentiments  # noqa: E402
+
+BATCHES = sorted((ROOT / 'sentiment_batches').glob('batch_*.json'))
+RESULTS = sorted((ROOT / 'sentiment_batches').glob('results_*.json'))
+
+
+def rebuild(mentions, sentiments):
+    engine = TrendEngine()
+    engine.add_mentions(mentions, sentiments)
+    return engine.export()
+
+
+def reload(engine, tmp_path):
+    path = tmp_path / 'trend_state.json'
+    engine.save(path)
+    return TrendEngine.load(path)
+
+
+def test_late_results_relabel_to_match_rebuild(tmp_path):
+    sentiments = load_sentiments(RESULTS)
+
+    engine = TrendEngine()
+    engine.add_mentions(iter_mentions(BATCHES[:20]), {})
+    engine = reload(engine, tmp_path)
+    added, relabelled = engine.add_mentions(iter_mentions(BATCHES), sentiments)
+
+    assert relabelled > 0
+    assert reload(engine, tmp_path).export() == rebuild(iter_mentions(BATCHES), sentiments)
+
+
+def test_changed_label_moves_counts(tmp_path):
+    mention = {'contributionExtId': 'A', 'date': '2024-01-10', 'house': 'Commons', 'party': {'abbreviation': 'Lab'}}
+    later = dict(mention, contributionExtId='B', date='2024-03-05')
+
+    engine = TrendEngine()
+    engine.add_mentions([mention, later], {'A': 'positive', 'B': 'negative'})
+    engine.add_mentions([], {'A': 'negative'})
+
+    assert engine.export() == rebuild([mention, later], {'A': 'negative', 'B': 'negative'})
+    january = engine.export()['monthly']['all']['all'][0]
+    assert (january['positive'], january['negative']) == (0, 1)
+
+
+def test_out_of_order_batches_match_rebuild():
+    sentiments = load_sentiments(RESULTS)
+
+    engine = TrendEngine()
+    for path in reversed(BATCHES):
+        engine.add_mentions(iter_mentions([path]), sentiments)
+
+    assert engine.export() == rebuild(iter_mentions(BATCHES), sentiments)